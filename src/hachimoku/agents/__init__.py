@@ -1,7 +1,7 @@
 """エージェント定義・ローダー。
 
 公開 API:
-    - モデル: Phase, PHASE_ORDER, ApplicabilityRule, AgentDefinition,
+    - モデル: Phase, PHASE_ORDER, phase_key, ApplicabilityRule, AgentDefinition,
               SelectorDefinition, LoadError, LoadResult
     - ローダー: load_builtin_agents, load_custom_agents, load_agents,
                 load_builtin_selector, load_selector
@@ -22,6 +22,7 @@ from hachimoku.agents.models import (
     LoadResult,
     Phase,
     SelectorDefinition,
+    phase_key,
 )
 
 __all__ = [
@@ -37,6 +38,7 @@ __all__ = [
     "load_builtin_selector",
     "load_custom_agents",
     "load_selector",
+    "phase_key",
 ]
 
 # ReviewReport.load_errors の遅延型参照を解決。
@@ -7,8 +7,11 @@ AggregatorDefinition モデルとして構築する。
 
 from __future__ import annotations
 
+import os
 import tomllib
 from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from importlib.resources import as_file, files
 from pathlib import Path
 from typing import Final, TypeVar
@@ -35,6 +38,9 @@ _EXCLUDED_FILENAMES: Final[frozenset[str]] = frozenset(
 )
 """レビューエージェントローダーから除外されるファイル名集合。"""
 
+_MAX_LOAD_WORKERS: Final[int] = 8
+"""カスタムエージェント定義を並行して読み込む際の最大スレッド数。"""
+
 _T = TypeVar("_T", bound=HachimokuBaseModel)
 
 
@@ -58,8 +64,7 @@ def _load_single_definition(path: Path, model_type: type[_T]) -> _T:
         pydantic.ValidationError: バリデーションエラーの場合。
         OSError: ファイルが存在しない場合やアクセスエラーの場合。
     """
-    with path.open("rb") as f:
-        data = tomllib.load(f)
+    data = tomllib.loads(path.read_text(encoding="utf-8"))
     return model_type.model_validate(data)
 
 
@@ -134,6 +139,36 @@ def _load_single_agent(path: Path) -> AgentDefinition:
     return _load_single_definition(path, AgentDefinition)
 
 
+def _load_agent_or_error(path: Path) -> AgentDefinition | LoadError:
+    """単一のエージェント定義を読み込み、読み込みエラーは LoadError として返す。
+
+    Args:
+        path: TOML ファイルのパス。
+
+    Returns:
+        読み込まれたエージェント定義、または読み込みエラー。
+    """
+    try:
+        return _load_single_agent(path)
+    except (tomllib.TOMLDecodeError, ValidationError, OSError) as e:
+        return LoadError(
+            source=path.name,
+            message=f"{type(e).__name__}: {e}",
+        )
+
+
+def _to_load_result(outcomes: Iterable[AgentDefinition | LoadError]) -> LoadResult:
+    """読み込み結果を順序を保ったまま agents と errors に振り分ける。"""
+    agents: list[AgentDefinition] = []
+    errors: list[LoadError] = []
+    for outcome in outcomes:
+        if isinstance(outcome, LoadError):
+            errors.append(outcome)
+        else:
+            agents.append(outcome)
+    return LoadResult(agents=tuple(agents), errors=tuple(errors))
+
+
 def _collect_agents(toml_paths: Iterable[Path]) -> LoadResult:
     """TOML ファイルパスのイテラブルからエージェント定義を収集する。
 
@@ -146,32 +181,21 @@ def _collect_agents(toml_paths: Iterable[Path]) -> LoadResult:
     Returns:
         収集されたエージェント定義とエラーの読み込み結果。
     """
-    agents: list[AgentDefinition] = []
-    errors: list[LoadError] = []
-
-    for path in toml_paths:
-        if not path.name.endswith(".toml"):
-            continue
-        if path.name in _EXCLUDED_FILENAMES:
-            continue
-        try:
-            agent = _load_single_agent(path)
-            agents.append(agent)
-        except (tomllib.TOMLDecodeError, ValidationError, OSError) as e:
-            errors.append(
-                LoadError(
-                    source=path.name,
-                    message=f"{type(e).__name__}: {e}",
-                )
-            )
-
-    return LoadResult(agents=tuple(agents), errors=tuple(errors))
+    return _to_load_result(
+        _load_agent_or_error(path)
+        for path in toml_paths
+        if path.name.endswith(".toml") and path.name not in _EXCLUDED_FILENAMES
+    )
 
 
+@cache
 def load_builtin_agents() -> LoadResult:
     """ビルトインエージェント定義をパッケージリソースから読み込む。
 
     selector.toml はセレクター専用ローダーで読み込むため除外される。
+    ビルトイン定義はパッケージに同梱され実行中に変化しないため、結果はプロセス内で
+    キャッシュされる。LoadResult は frozen のため共有しても安全。
+    キャッシュの破棄は ``load_builtin_agents.cache_clear()`` で行う。
 
     Returns:
         ビルトイン定義の読み込み結果。個々のファイルの読み込みエラーは
@@ -217,7 +241,20 @@ def load_custom_agents(custom_dir: Path) -> LoadResult:
             f"custom_dir はディレクトリではありません: {custom_dir}"
         )
 
-    return _collect_agents(sorted(custom_dir.iterdir()))
+    with os.scandir(custom_dir) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".toml") and entry.name not in _EXCLUDED_FILENAMES
+        )
+    paths = [custom_dir / name for name in names]
+    if len(paths) <= 1:
+        return _collect_agents(paths)
+
+    # ファイル読み込みの I/O 待ちを重ねるためスレッドで並行に読み込む。
+    # map は入力順で結果を返すため、ファイル名順の並びは維持される。
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(paths))) as executor:
+        return _to_load_result(executor.map(_load_agent_or_error, paths))
 
 
 def load_agents(custom_dir: Path | None = None) -> LoadResult:
@@ -7,8 +7,10 @@ LoadError（読み込みエラー）、LoadResult（読み込み結果）を定
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from enum import StrEnum
+from functools import cached_property, lru_cache
+from operator import attrgetter
 from types import MappingProxyType
 from typing import Annotated, Final
 
@@ -23,37 +25,68 @@ from hachimoku.models.schemas import BaseAgentOutput, SchemaNotFoundError, get_s
 # =============================================================================
 
 
+_PHASE_ORDER_VALUES: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "early": 0,
+        "main": 1,
+        "final": 2,
+    }
+)
+"""Phase の値から順序値への対応表（数値が小さいほど先に実行）。"""
+
+
 class Phase(StrEnum):
     """エージェントの実行フェーズ。
 
     実行順序: EARLY → MAIN → FINAL
     同フェーズ内のエージェントは名前の辞書順で実行される。
+    順序値はメンバー生成時に _order_val として各メンバーに保持する。
     """
 
+    _order_val: int
+
     EARLY = "early"
     MAIN = "main"
     FINAL = "final"
 
+    def __init__(self, value: str) -> None:
+        self._order_val = _PHASE_ORDER_VALUES[value]
+
 
 # Phase の順序定義（数値が小さいほど先に実行）
 PHASE_ORDER: Final[Mapping[Phase, int]] = MappingProxyType(
-    {
-        Phase.EARLY: 0,
-        Phase.MAIN: 1,
-        Phase.FINAL: 2,
-    }
+    {phase: phase._order_val for phase in Phase}
 )
 
 assert set(PHASE_ORDER.keys()) == set(Phase), (
     "PHASE_ORDER keys must match Phase members"
 )
 
+phase_key: Final[Callable[[Phase], int]] = attrgetter("_order_val")
+"""Phase の順序値（PHASE_ORDER と同値）を返すキー関数。
+
+sorted() 等の key に使用すると、PHASE_ORDER の辞書引きを経由せず属性参照で比較できる。
+"""
+
 
 # =============================================================================
 # ApplicabilityRule（適用ルール）
 # =============================================================================
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """正規表現をコンパイルする。
+
+    ビルトイン定義は読み込みのたびに同じパターンを検証するため、結果をキャッシュする。
+    コンパイルに失敗したパターンはキャッシュされない。
+
+    Raises:
+        re.error: 無効な正規表現の場合。
+    """
+    return re.compile(pattern)
+
+
 class ApplicabilityRule(HachimokuBaseModel):
     """エージェントの適用条件。
 
@@ -64,24 +97,49 @@ class ApplicabilityRule(HachimokuBaseModel):
     4. 上記いずれも該当しない → 不適用
 
     条件 2 と 3 は OR 関係。
+
+    content_patterns のマッチングには compiled_content_patterns を使用し、
+    照合のたびに正規表現を再コンパイルしないこと。
     """
 
     always: bool = False
     file_patterns: tuple[str, ...] = ()
     content_patterns: tuple[str, ...] = ()
 
+    @cached_property
+    def compiled_content_patterns(self) -> tuple[re.Pattern[str], ...]:
+        """content_patterns のコンパイル済み正規表現。
+
+        フィールドではないためシリアライズ対象外。パターンはバリデーション時に
+        コンパイル済みのため、ここではキャッシュから取り出すだけになる。
+        """
+        return tuple(_compile_pattern(p) for p in self.content_patterns)
+
     @field_validator("content_patterns")
     @classmethod
     def validate_regex_patterns(cls, v: tuple[str, ...]) -> tuple[str, ...]:
         """各パターンが有効な正規表現であることを検証する。"""
         for pattern in v:
             try:
-                re.compile(pattern)
+                _compile_pattern(pattern)
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern '{pattern}': {e}") from None
         return v
 
 
+_ALWAYS_APPLICABLE: Final[ApplicabilityRule] = ApplicabilityRule(always=True)
+"""applicability 未指定時のデフォルト。frozen のため全エージェントで共有する。"""
+
+
+@lru_cache(maxsize=256)
+def _intern_rule(rule: ApplicabilityRule) -> ApplicabilityRule:
+    """等価な ApplicabilityRule を最初に生成されたインスタンスに集約する。
+
+    ApplicabilityRule は frozen でハッシュ可能なため、キャッシュのキーとして使用できる。
+    """
+    return rule
+
+
 # =============================================================================
 # LoadError（読み込みエラー情報）
 # =============================================================================
@@ -101,6 +159,12 @@ class LoadError(HachimokuBaseModel):
 # エージェント名のバリデーションパターン
 AGENT_NAME_PATTERN: Final[str] = r"^[a-z0-9-]+$"
 
+AGENT_NAME_RE: Final[re.Pattern[str]] = re.compile(AGENT_NAME_PATTERN)
+"""AGENT_NAME_PATTERN のコンパイル済み正規表現。
+
+pydantic の Field(pattern=...) を経由せずにエージェント名を検証する箇所で共有する。
+"""
+
 
 def _validate_tool_categories(
     v: tuple[str, ...] | list[str],
@@ -159,13 +223,17 @@ class AgentDefinition(HachimokuBaseModel):
     resolved_schema: type[BaseAgentOutput] = Field(exclude=True)
     system_prompt: str = Field(min_length=1)
     allowed_tools: _ValidatedTools = ()
-    applicability: ApplicabilityRule = Field(
-        default_factory=lambda: ApplicabilityRule(always=True)
-    )
+    applicability: ApplicabilityRule = _ALWAYS_APPLICABLE
     phase: Phase = Phase.MAIN
     max_turns: int | None = Field(default=None, gt=0)
     timeout: int | None = Field(default=None, gt=0)
 
+    @field_validator("applicability")
+    @classmethod
+    def intern_applicability(cls, v: ApplicabilityRule) -> ApplicabilityRule:
+        """同一内容の適用ルールを共有インスタンスに置き換える。"""
+        return _intern_rule(v)
+
     @model_validator(mode="before")
     @classmethod
     def resolve_output_schema(cls, data: dict[str, object]) -> dict[str, object]:
@@ -17,6 +17,7 @@ from hachimoku.models.history import (
     DiffReviewRecord,
     FileReviewRecord,
     PRReviewRecord,
+    dump_history_record,
 )
 from hachimoku.models.report import ReviewReport
 
@@ -223,9 +224,8 @@ def save_review_history(
     jsonl_path = _resolve_jsonl_path(reviews_dir, target)
 
     try:
-        with jsonl_path.open("a", encoding="utf-8") as f:
-            f.write(record.model_dump_json())
-            f.write("\n")
+        with jsonl_path.open("ab") as f:
+            f.write(dump_history_record(record) + b"\n")
     except OSError as exc:
         raise HistoryWriteError(
             f"Failed to write review history to {jsonl_path}: {exc}\n"
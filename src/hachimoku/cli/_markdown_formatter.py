@@ -25,7 +25,7 @@ from hachimoku.models.report import (
     ReviewSummary,
 )
 from hachimoku.models.review import ReviewIssue
-from hachimoku.models.severity import SEVERITY_ORDER
+from hachimoku.models.severity import severity_key
 
 
 def format_markdown(report: ReviewReport) -> str:
@@ -116,7 +116,7 @@ def _format_issues(issues: list[ReviewIssue]) -> str:
 
     sorted_issues = sorted(
         issues,
-        key=lambda i: SEVERITY_ORDER[i.severity.value],
+        key=lambda i: severity_key(i.severity),
         reverse=True,
     )
 
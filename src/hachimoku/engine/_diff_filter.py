@@ -9,7 +9,8 @@ from __future__ import annotations
 import fnmatch
 import logging
 import re
-from os.path import basename
+from functools import lru_cache
+from os.path import basename, normcase
 from typing import Final
 
 logger = logging.getLogger(__name__)
@@ -21,13 +22,23 @@ _FILE_PATH_RE: Final[re.Pattern[str]] = re.compile(r"diff --git a/.+ b/(.+)")
 """diff --git ヘッダーからファイルパス（b/側）を抽出するパターン。"""
 
 
+@lru_cache(maxsize=128)
+def _compile_file_patterns(file_patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """fnmatch 互換パターン群を1つの正規表現に結合してコンパイルする。
+
+    fnmatch.fnmatch と同様に、パターンは os.path.normcase で正規化してから変換する。
+    エージェントの file_patterns ごとに1回だけコンパイルされる。
+    """
+    return re.compile("|".join(fnmatch.translate(normcase(p)) for p in file_patterns))
+
+
 def filter_diff_by_file_patterns(
     diff_text: str,
     file_patterns: tuple[str, ...],
 ) -> str:
     """unified diff をファイル単位で分割し、file_patterns にマッチするファイルのみ抽出する。
 
-    fnmatch でファイルの basename に対してマッチングを行う。
+    fnmatch 互換でファイルの basename に対してマッチングを行う。
     マッチするファイルがない場合は diff_text をそのまま返す（フィルタリング不適用）。
     diff_text が空、unified diff フォーマットでない、またはパターンが空の場合は
     そのまま返す。
@@ -46,6 +57,7 @@ def filter_diff_by_file_patterns(
     if not positions:
         return diff_text
 
+    matcher = _compile_file_patterns(file_patterns)
     matched_sections: list[str] = []
     seen_paths: set[str] = set()
 
@@ -64,8 +76,7 @@ def filter_diff_by_file_patterns(
         if file_path in seen_paths:
             continue
 
-        file_basename = basename(file_path)
-        if any(fnmatch.fnmatch(file_basename, p) for p in file_patterns):
+        if matcher.match(normcase(basename(file_path))):
             matched_sections.append(section)
             seen_paths.add(file_path)
 
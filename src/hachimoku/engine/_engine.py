@@ -55,7 +55,7 @@ from hachimoku.models.agent_result import (
 from hachimoku.models.config import HachimokuConfig
 from hachimoku.models.report import ReviewReport, ReviewSummary
 from hachimoku.models.review import ReviewIssue
-from hachimoku.models.severity import Severity, determine_exit_code
+from hachimoku.models.severity import Severity, determine_exit_code, severity_key
 
 
 SHUTDOWN_TIMEOUT_SECONDS: Final[float] = 3.0
@@ -542,7 +542,7 @@ def _build_summary(results: list[AgentResult]) -> ReviewSummary:
 
     max_severity: Severity | None = None
     if all_issues:
-        max_severity = max(issue.severity for issue in all_issues)
+        max_severity = max((issue.severity for issue in all_issues), key=severity_key)
 
     total_elapsed = sum(
         r.elapsed_time for r in results if isinstance(r, (AgentSuccess, AgentTruncated))
@@ -11,9 +11,9 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING
 
-from hachimoku.agents.models import Phase
+from hachimoku.agents.models import phase_key
 from hachimoku.engine._context import AgentExecutionContext
 from hachimoku.engine._progress import PlainProgressReporter
 from hachimoku.engine._runner import run_agent
@@ -22,9 +22,6 @@ from hachimoku.models.agent_result import AgentResult
 if TYPE_CHECKING:
     from hachimoku.engine._progress import ProgressReporter
 
-PHASE_SEQUENCE: Final[tuple[Phase, ...]] = (Phase.EARLY, Phase.MAIN, Phase.FINAL)
-"""フェーズの実行順序。"""
-
 
 def _resolve_reporter(reporter: ProgressReporter | None) -> ProgressReporter:
     """reporter が None の場合は PlainProgressReporter を生成する。"""
@@ -33,6 +30,11 @@ def _resolve_reporter(reporter: ProgressReporter | None) -> ProgressReporter:
     return reporter
 
 
+def _phase_then_name(context: AgentExecutionContext) -> tuple[int, str]:
+    """group_by_phase のソートキー（フェーズ順 → エージェント名）。"""
+    return phase_key(context.phase), context.agent_name
+
+
 def group_by_phase(
     contexts: list[AgentExecutionContext],
 ) -> dict[str, list[AgentExecutionContext]]:
@@ -49,13 +51,8 @@ def group_by_phase(
         フェーズ名 → コンテキストリストの辞書（フェーズ順）。
     """
     grouped: dict[str, list[AgentExecutionContext]] = {}
-    for phase in PHASE_SEQUENCE:
-        phase_contexts = sorted(
-            (c for c in contexts if c.phase == phase),
-            key=lambda c: c.agent_name,
-        )
-        if phase_contexts:
-            grouped[phase.value] = phase_contexts
+    for context in sorted(contexts, key=_phase_then_name):
+        grouped.setdefault(context.phase.value, []).append(context)
     return grouped
 
 
@@ -16,7 +16,7 @@ from rich.status import Status
 from rich.table import Table
 from rich.text import Text
 
-from hachimoku.agents.models import PHASE_ORDER, Phase
+from hachimoku.agents.models import Phase, phase_key
 from hachimoku.engine._progress import SELECTOR_START_MESSAGE
 from hachimoku.models.agent_result import (
     AgentError,
@@ -57,14 +57,16 @@ class RichProgressReporter:
 
     def on_agent_start(self, agent_name: str) -> None:
         """エージェント実行開始を通知し、ステータスを running に更新する。"""
-        if agent_name in self.agents:
-            self.agents[agent_name].status = "running"
+        row = self.agents.get(agent_name)
+        if row is not None:
+            row.status = "running"
             self._refresh()
 
     def on_agent_complete(self, agent_name: str, result: AgentResult) -> None:
         """エージェント実行完了を通知し、ステータスを結果に応じて更新する。"""
-        if agent_name in self.agents:
-            self.agents[agent_name].status = _format_completion_status(result)
+        row = self.agents.get(agent_name)
+        if row is not None:
+            row.status = _format_completion_status(result)
             self._refresh()
 
     def start(self) -> None:
@@ -95,7 +97,7 @@ class RichProgressReporter:
 
         sorted_agents = sorted(
             self.agents.items(),
-            key=lambda item: (PHASE_ORDER[item[1].phase], item[0]),
+            key=lambda item: (phase_key(item[1].phase), item[0]),
         )
 
         for name, row in sorted_agents:
@@ -10,12 +10,15 @@ from hachimoku.models.agent_result import (
     CostInfo,
 )
 from hachimoku.models.history import (
+    REVIEW_HISTORY_ADAPTER,
     CommitHash,
     CommitReviewRecord,
     DiffReviewRecord,
     FileReviewRecord,
     PRReviewRecord,
     ReviewHistoryRecord,
+    dump_history_record,
+    load_history_record,
 )
 from hachimoku.models.report import (
     AggregatedReport,
@@ -48,6 +51,7 @@ from hachimoku.models.severity import (
     SEVERITY_ORDER,
     Severity,
     determine_exit_code,
+    severity_key,
 )
 
 
@@ -79,6 +83,7 @@ __all__ = [
     "ReviewHistoryRecord",
     "ReviewIssue",
     "RecommendedAction",
+    "REVIEW_HISTORY_ADAPTER",
     "ReviewReport",
     "ReviewSummary",
     "SCHEMA_REGISTRY",
@@ -90,6 +95,9 @@ __all__ = [
     "TestGapAssessment",
     "ToolCategory",
     "determine_exit_code",
+    "dump_history_record",
     "get_schema",
+    "load_history_record",
     "register_schema",
+    "severity_key",
 ]
@@ -4,15 +4,41 @@ FR-DM-009: extra="forbid" で厳格モードを一元管理。
 FR-DM-010: normalize_enum_value による StrEnum ケース正規化。
 """
 
+from collections.abc import Mapping
 from enum import StrEnum
+from functools import cache
+from types import MappingProxyType
 
 from pydantic import BaseModel, ConfigDict
 
 
 class HachimokuBaseModel(BaseModel):
-    """全ドメインモデルの基底クラス。extra="forbid" で厳格モードを一元管理。"""
+    """全ドメインモデルの基底クラス。extra="forbid" で厳格モードを一元管理。
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    revalidate_instances="never" を明示し、構築済みのモデルインスタンスを
+    フィールドに渡した場合は再バリデーションせずそのまま保持する。
+    エンジンの集約経路（ReviewReport 構築等）はこれを前提とする。
+
+    protected_namespaces=() により、クラス定義時のフィールド名プレフィックス
+    検査（pydantic 予約の model_validate / model_dump 等との衝突チェック）を省略する。
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        frozen=True,
+        revalidate_instances="never",
+        protected_namespaces=(),
+    )
+
+
+@cache
+def _lowercase_value_map(enum_cls: type[StrEnum]) -> Mapping[str, str]:
+    """enum_cls の小文字化した値から正規の値文字列への対応表を返す。
+
+    StrEnum クラスごとに一度だけ構築し、バリデーションのたびに
+    メンバーを走査しないようにする。
+    """
+    return MappingProxyType({member.value.lower(): member.value for member in enum_cls})
 
 
 def normalize_enum_value[E: StrEnum](v: object, enum_cls: type[E]) -> object:
@@ -30,7 +56,5 @@ def normalize_enum_value[E: StrEnum](v: object, enum_cls: type[E]) -> object:
         正規化された値文字列、またはマッチしない場合は入力値そのまま。
     """
     if isinstance(v, str):
-        for member in enum_cls:
-            if v.lower() == member.value.lower():
-                return member.value
+        return _lowercase_value_map(enum_cls).get(v.lower(), v)
     return v
@@ -8,7 +8,6 @@ FR-CF-010: セレクターエージェント設定
 
 from __future__ import annotations
 
-import re
 from enum import StrEnum
 from typing import Final
 
@@ -16,15 +15,13 @@ from typing import Annotated
 
 from pydantic import Field, StringConstraints, StrictBool, field_validator
 
-from hachimoku.agents.models import AGENT_NAME_PATTERN
+from hachimoku.agents.models import AGENT_NAME_PATTERN, AGENT_NAME_RE
 from hachimoku.models._base import HachimokuBaseModel
 
 # _prefetch.DEFAULT_CONVENTION_FILES と同値。
 # 循環インポート（config → engine._prefetch → engine/__init__ → _engine → config）を避けるためリテラル定義。
 _DEFAULT_CONVENTION_FILES: tuple[str, ...] = ("CLAUDE.md", ".hachimoku/config.toml")
 
-# 既存の AGENT_NAME_PATTERN (str) をコンパイル済み正規表現として使用
-_AGENT_NAME_RE: re.Pattern[str] = re.compile(AGENT_NAME_PATTERN)
 
 # グローバルデフォルト値（Issue #130: 複雑なレビューに対応するため引き上げ）
 DEFAULT_TIMEOUT_SECONDS: Final[int] = 600
@@ -141,7 +138,7 @@ class HachimokuConfig(HachimokuBaseModel):
     def validate_agent_names(cls, v: dict[str, AgentConfig]) -> dict[str, AgentConfig]:
         """エージェント名の形式を検証する。FR-CF-004."""
         for name in v:
-            if not _AGENT_NAME_RE.fullmatch(name):
+            if not AGENT_NAME_RE.fullmatch(name):
                 msg = (
                     f"Invalid agent name '{name}': "
                     f"must match pattern {AGENT_NAME_PATTERN}"
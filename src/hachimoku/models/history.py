@@ -10,7 +10,7 @@ from datetime import datetime
 from pathlib import PurePosixPath
 from typing import Annotated, Literal, Union
 
-from pydantic import Field, field_validator
+from pydantic import Field, TypeAdapter, field_validator
 
 from hachimoku.models._base import HachimokuBaseModel
 from hachimoku.models.agent_result import AgentResult
@@ -125,8 +125,49 @@ class CommitReviewRecord(HachimokuBaseModel):
     summary: ReviewSummary
 
 
+# NOTE: PEP 695 の `type` 文による型エイリアスに変換しないこと。
+# TypeAliasType でラップすると判別共用体の review_mode によるディスパッチが
+# 効かなくなり、全バリアントのバリデータが順に試行される。
+# 利用側は TypeAdapter で再ラップせず REVIEW_HISTORY_ADAPTER を使用する。
 ReviewHistoryRecord = Annotated[
     Union[DiffReviewRecord, PRReviewRecord, FileReviewRecord, CommitReviewRecord],
     Field(discriminator="review_mode"),
 ]
 """レビュー履歴レコードの判別共用体。review_mode フィールドの値で型を自動選択する。"""
+
+
+REVIEW_HISTORY_ADAPTER: TypeAdapter[
+    DiffReviewRecord | PRReviewRecord | FileReviewRecord | CommitReviewRecord
+] = TypeAdapter(ReviewHistoryRecord)
+"""ReviewHistoryRecord の TypeAdapter。JSON の直列化・復元を pydantic-core で一括処理する。"""
+
+
+def dump_history_record(
+    record: DiffReviewRecord | PRReviewRecord | FileReviewRecord | CommitReviewRecord,
+) -> bytes:
+    """履歴レコードを JSON バイト列に直列化する。
+
+    Args:
+        record: 直列化対象の履歴レコード。
+
+    Returns:
+        JSON エンコード済みのバイト列（末尾改行なし）。
+    """
+    return REVIEW_HISTORY_ADAPTER.dump_json(record)
+
+
+def load_history_record(
+    raw: str | bytes,
+) -> DiffReviewRecord | PRReviewRecord | FileReviewRecord | CommitReviewRecord:
+    """JSON 文字列またはバイト列から履歴レコードを復元する。
+
+    Args:
+        raw: JSONL の1行分の JSON データ。
+
+    Returns:
+        review_mode に応じて選択された履歴レコード。
+
+    Raises:
+        pydantic.ValidationError: JSON が不正、またはスキーマに適合しない場合。
+    """
+    return REVIEW_HISTORY_ADAPTER.validate_json(raw)
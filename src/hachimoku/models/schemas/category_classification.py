@@ -5,11 +5,31 @@ comment-analyzer が使用する出力スキーマ。
 
 from __future__ import annotations
 
+from pydantic import model_validator
+
 from hachimoku.models.review import ReviewIssue
 from hachimoku.models.schemas._base import BaseAgentOutput
 
 
 class CategoryClassification(BaseAgentOutput):
-    """カテゴリ分類。"""
+    """カテゴリ分類。
+
+    同一の ReviewIssue が複数カテゴリ（および issues）に現れる場合、
+    バリデーション後に等価なインスタンスを1つに集約して共有する。
+    """
 
     categories: dict[str, list[ReviewIssue]]
+
+    @model_validator(mode="after")
+    def intern_category_issues(self) -> CategoryClassification:
+        """issues と categories 間で等価な ReviewIssue を同一インスタンスに集約する。
+
+        ReviewIssue は frozen でハッシュ可能なため、等価判定に dict を用いる。
+        モデル自体は frozen だが、各リストは生成直後のためインプレースで置換する。
+        """
+        seen: dict[ReviewIssue, ReviewIssue] = {}
+        for issue in self.issues:
+            seen.setdefault(issue, issue)
+        for issues in self.categories.values():
+            issues[:] = [seen.setdefault(issue, issue) for issue in issues]
+        return self
@@ -3,10 +3,9 @@
 FR-DM-001: Critical > Important > Suggestion > Nitpick の4段階順序。
 """
 
-from __future__ import annotations
-
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from enum import StrEnum
+from operator import attrgetter
 from types import MappingProxyType
 from typing import Final
 
@@ -22,51 +21,86 @@ SEVERITY_ORDER: Final[Mapping[str, int]] = MappingProxyType(
     }
 )
 
+_EXIT_CODE_BY_SEVERITY: Final[Mapping[str, ExitCode]] = MappingProxyType(
+    {
+        "Nitpick": ExitCode.SUCCESS,
+        "Suggestion": ExitCode.SUCCESS,
+        "Important": ExitCode.IMPORTANT,
+        "Critical": ExitCode.CRITICAL,
+    }
+)
+"""重大度の値から、その重大度が最大であった場合の終了コードへの対応表。"""
+
+
+def _reject_str_operand(other: object, op: str) -> None:
+    """Severity と str の比較を TypeError として拒否する。
+
+    str は Severity の基底型であり、NotImplemented を返すと反射演算で
+    辞書順比較が成立してしまうため、比較演算子から直接 TypeError を送出する。
+    str 以外の型は呼び出し側で NotImplemented を返し、反射演算を相手側に委ねる。
+    """
+    if isinstance(other, str):
+        raise TypeError(
+            f"'{op}' not supported between instances of 'Severity' and '{type(other).__name__}'"
+        )
+
 
 class Severity(StrEnum):
     """レビュー問題の重大度。PascalCase で内部保持。
 
     順序関係: Critical > Important > Suggestion > Nitpick
     比較演算は SEVERITY_ORDER に基づくカスタム実装を提供する。
-    非 Severity 型との比較は TypeError を送出する。
+    順序値はメンバー生成時に _order_val として各メンバーに保持し、
+    比較のたびに SEVERITY_ORDER を引かない。
+    同様に、最大重大度であった場合の終了コードを exit_code として保持する。
+    非 Severity 型との比較は NotImplemented を返し、最終的に TypeError となる
+    （str との比較は辞書順比較へのフォールバックを防ぐため直接 TypeError を送出する）。
+    str を継承するため functools.total_ordering は使えず、4つの比較演算子を個別に定義する。
     """
 
+    _order_val: int
+    exit_code: ExitCode
+
     CRITICAL = "Critical"
     IMPORTANT = "Important"
     SUGGESTION = "Suggestion"
     NITPICK = "Nitpick"
 
-    def _order(self) -> int:
-        """SEVERITY_ORDER から重大度の順序値を取得する。"""
-        return SEVERITY_ORDER[self.value]
+    def __init__(self, value: str) -> None:
+        self._order_val = SEVERITY_ORDER[value]
+        self.exit_code = _EXIT_CODE_BY_SEVERITY[value]
 
     def __lt__(self, other: object) -> bool:
-        if not isinstance(other, Severity):
-            raise TypeError(
-                f"'<' not supported between instances of 'Severity' and '{type(other).__name__}'"
-            )
-        return self._order() < other._order()
+        if isinstance(other, Severity):
+            return self._order_val < other._order_val
+        _reject_str_operand(other, "<")
+        return NotImplemented
 
     def __le__(self, other: object) -> bool:
-        if not isinstance(other, Severity):
-            raise TypeError(
-                f"'<=' not supported between instances of 'Severity' and '{type(other).__name__}'"
-            )
-        return self._order() <= other._order()
+        if isinstance(other, Severity):
+            return self._order_val <= other._order_val
+        _reject_str_operand(other, "<=")
+        return NotImplemented
 
     def __gt__(self, other: object) -> bool:
-        if not isinstance(other, Severity):
-            raise TypeError(
-                f"'>' not supported between instances of 'Severity' and '{type(other).__name__}'"
-            )
-        return self._order() > other._order()
+        if isinstance(other, Severity):
+            return self._order_val > other._order_val
+        _reject_str_operand(other, ">")
+        return NotImplemented
 
     def __ge__(self, other: object) -> bool:
-        if not isinstance(other, Severity):
-            raise TypeError(
-                f"'>=' not supported between instances of 'Severity' and '{type(other).__name__}'"
-            )
-        return self._order() >= other._order()
+        if isinstance(other, Severity):
+            return self._order_val >= other._order_val
+        _reject_str_operand(other, ">=")
+        return NotImplemented
+
+
+severity_key: Final[Callable[[Severity], int]] = attrgetter("_order_val")
+"""Severity の順序値（SEVERITY_ORDER と同値）を返すキー関数。
+
+sorted() 等の key に使用すると、値文字列での SEVERITY_ORDER 引きや
+比較演算子の呼び出しを経由せず int 同士で比較できる。
+"""
 
 
 def determine_exit_code(max_severity: Severity | None) -> ExitCode:
@@ -84,14 +118,7 @@ def determine_exit_code(max_severity: Severity | None) -> ExitCode:
     if max_severity is None:
         return ExitCode.SUCCESS
 
-    severity_to_exit_code: dict[Severity, ExitCode] = {
-        Severity.CRITICAL: ExitCode.CRITICAL,
-        Severity.IMPORTANT: ExitCode.IMPORTANT,
-        Severity.SUGGESTION: ExitCode.SUCCESS,
-        Severity.NITPICK: ExitCode.SUCCESS,
-    }
-
-    if max_severity not in severity_to_exit_code:
-        raise ValueError(f"Unknown Severity value: {max_severity}")
-
-    return severity_to_exit_code[max_severity]
+    try:
+        return Severity(max_severity).exit_code
+    except ValueError:
+        raise ValueError(f"Unknown Severity value: {max_severity}") from None
@@ -5,8 +5,6 @@
 循環依存を回避するため 002-domain-models に配置（004-configuration spec.md Q5）。
 """
 
-from __future__ import annotations
-
 from collections.abc import Mapping
 from enum import StrEnum
 from types import MappingProxyType
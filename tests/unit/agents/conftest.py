@@ -0,0 +1,69 @@
+"""agents テスト共通フィクスチャ。"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import Final
+
+import pytest
+
+from hachimoku.agents.loader import load_builtin_agents, load_builtin_selector
+from hachimoku.agents.models import AgentDefinition, LoadResult, SelectorDefinition
+
+_RAM_BACKED_DIR: Final[Path] = Path("/dev/shm")
+"""RAM 上のファイルシステム（tmpfs）。利用可能なプラットフォームでのみ使用する。"""
+
+
+@pytest.fixture(scope="session")
+def builtin_result() -> LoadResult:
+    """ビルトインエージェントの読み込み結果。セッション内で1回だけ実行。
+
+    LoadResult と AgentDefinition は frozen のため、テスト間で共有しても変更されない。
+    """
+    return load_builtin_agents()
+
+
+@pytest.fixture(scope="session")
+def builtin_agents(builtin_result: LoadResult) -> tuple[AgentDefinition, ...]:
+    """ビルトインエージェントのタプル。"""
+    return builtin_result.agents
+
+
+@pytest.fixture(scope="session")
+def builtin_names(builtin_agents: tuple[AgentDefinition, ...]) -> frozenset[str]:
+    """ビルトインエージェント名の集合。"""
+    return frozenset(agent.name for agent in builtin_agents)
+
+
+@pytest.fixture(scope="session")
+def builtin_agents_by_name(
+    builtin_agents: tuple[AgentDefinition, ...],
+) -> Mapping[str, AgentDefinition]:
+    """エージェント名からビルトインエージェントへの対応表。"""
+    return MappingProxyType({agent.name: agent for agent in builtin_agents})
+
+
+@pytest.fixture(scope="session")
+def builtin_selector() -> SelectorDefinition:
+    """ビルトインセレクター定義。セッション内で1回だけ読み込む。"""
+    return load_builtin_selector()
+
+
+@pytest.fixture
+def tmp_path_ram(request: pytest.FixtureRequest) -> Iterator[Path]:
+    """TOML 書き出し→読み込みの往復テスト用一時ディレクトリ。
+
+    /dev/shm が書き込み可能なら RAM 上に作成してディスク I/O を避ける。
+    利用できないプラットフォームでは tmp_path にフォールバックする。
+    tmp_path はフォールバック時にのみ要求し、RAM 利用時にディスク上の
+    一時ディレクトリを作らないようにする。
+    """
+    if not (_RAM_BACKED_DIR.is_dir() and os.access(_RAM_BACKED_DIR, os.W_OK)):
+        yield request.getfixturevalue("tmp_path")
+        return
+    with tempfile.TemporaryDirectory(dir=_RAM_BACKED_DIR, prefix="hachimoku-") as d:
+        yield Path(d)
@@ -1,8 +1,8 @@
 """エージェントローダーのテスト。
 
 T013: _load_single_agent — 正常 TOML, 不正 TOML 構文, 必須フィールド欠損
-T014: load_builtin_agents — 6エージェント全件, 各名前存在, errors 空,
-      エラー収集パスの検証
+T014: load_builtin_agents — 6エージェント全件, 各名前存在, errors 空
+      （エラー収集パスは test_loader_error_collection.py）
 T015: builtin agent validation — output_schema, phase, applicability
 T030: load_custom_agents — カスタム定義読み込み, ディレクトリ不在, 部分失敗
 T031: load_agents — ビルトイン+カスタム統合, 同名上書き, エラー統合
@@ -15,8 +15,10 @@ T-118-003: load_builtin_agents / load_custom_agents — selector.toml 除外
 from __future__ import annotations
 
 import tomllib
+from collections.abc import Mapping
 from pathlib import Path
-from unittest.mock import patch
+from types import MappingProxyType
+from typing import Final, NamedTuple
 
 import pytest
 from pydantic import ValidationError
@@ -27,7 +29,6 @@ from hachimoku.agents.loader import (
     load_aggregator,
     load_builtin_agents,
     load_builtin_aggregator,
-    load_builtin_selector,
     load_custom_agents,
     load_selector,
 )
@@ -52,6 +53,34 @@ output_schema = "scored_issues"
 system_prompt = "You are a test agent."
 """
 
+VALID_TOML_BYTES = VALID_TOML.encode("utf-8")
+"""VALID_TOML を無加工で書き出すテスト用の UTF-8 エンコード済みバイト列。"""
+
+APPLICABILITY_TOML = (
+    VALID_TOML
+    + """\
+
+[applicability]
+file_patterns = ["*.py", "*.ts"]
+content_patterns = ["class\\\\s+\\\\w+"]
+"""
+)
+"""[applicability] セクション付きの VALID_TOML。"""
+
+WITH_TOOLS_TOML = VALID_TOML.replace(
+    'system_prompt = "You are a test agent."',
+    'system_prompt = "You are a test agent."\nallowed_tools = ["git_read", "file_read"]',
+)
+"""allowed_tools 指定付きの VALID_TOML。"""
+
+WITH_PHASE_TOML = VALID_TOML + 'phase = "early"\n'
+"""phase = "early" 指定付きの VALID_TOML。"""
+
+OVERRIDE_TOML = VALID_TOML.replace("test-agent", "code-reviewer").replace(
+    "A test agent", "Custom code reviewer"
+)
+"""ビルトイン code-reviewer を上書きするカスタム定義。"""
+
 BUILTIN_AGENT_NAMES = frozenset(
     {
         "architecture-reviewer",
@@ -69,14 +98,51 @@ BUILTIN_AGENT_NAMES = frozenset(
     }
 )
 
+SORTED_BUILTIN_AGENT_NAMES: Final[tuple[str, ...]] = tuple(sorted(BUILTIN_AGENT_NAMES))
+"""パラメータ化用に1回だけ整列したビルトインエージェント名。"""
+
 
-def _write_toml(tmp_path: Path, filename: str, content: str) -> Path:
-    """tmp_path に TOML ファイルを書き出す。"""
+def _write_toml(tmp_path: Path, filename: str, content: str | bytes) -> Path:
+    """tmp_path に TOML ファイルを書き出す。bytes はエンコードせずそのまま書き出す。"""
     toml_path = tmp_path / filename
-    toml_path.write_text(content, encoding="utf-8")
+    if isinstance(content, bytes):
+        toml_path.write_bytes(content)
+    else:
+        toml_path.write_text(content, encoding="utf-8")
     return toml_path
 
 
+def _write_many(directory: Path, files: Mapping[str, str | bytes]) -> None:
+    """directory にファイル名→内容の対応をまとめて書き出す。
+
+    str は UTF-8 でエンコードし、全ファイルを write_bytes で書き出す。
+    """
+    for name, content in files.items():
+        (directory / name).write_bytes(
+            content if isinstance(content, bytes) else content.encode("utf-8")
+        )
+
+
+@pytest.fixture
+def agent(
+    request: pytest.FixtureRequest,
+    builtin_agents_by_name: Mapping[str, AgentDefinition],
+) -> AgentDefinition:
+    """indirect パラメータのエージェント名をビルトインエージェントに解決する。"""
+    return builtin_agents_by_name[request.param]
+
+
+@pytest.fixture(scope="session")
+def valid_agent_toml(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """VALID_TOML を書き出した共有ファイル。セッション内で1回だけ作成。
+
+    読み込みのみ行うテスト専用。ファイルを書き換えるテストは tmp_path を使うこと。
+    """
+    return _write_toml(
+        tmp_path_factory.mktemp("agents_shared"), "test-agent.toml", VALID_TOML_BYTES
+    )
+
+
 def _get_self_filtering_section(system_prompt: str) -> str:
     """system_prompt から Self-Filtering Rules セクションを抽出する。"""
     marker = "## Self-Filtering Rules"
@@ -91,29 +157,12 @@ def _get_self_filtering_section(system_prompt: str) -> str:
     return section
 
 
-def _find_agent(agents: tuple[AgentDefinition, ...], name: str) -> AgentDefinition:
+def _find_agent(by_name: Mapping[str, AgentDefinition], name: str) -> AgentDefinition:
     """名前でエージェントを検索する。見つからなければ AssertionError。"""
-    for agent in agents:
-        if agent.name == name:
-            return agent
-    raise AssertionError(f"Agent '{name}' not found in {[a.name for a in agents]}")
-
-
-# =============================================================================
-# Fixtures（T014, T015 用）
-# =============================================================================
-
-
-@pytest.fixture(scope="module")
-def builtin_result() -> LoadResult:
-    """ビルトインエージェントの読み込み結果。モジュール内で1回だけ実行。"""
-    return load_builtin_agents()
-
-
-@pytest.fixture(scope="module")
-def builtin_agents(builtin_result: LoadResult) -> tuple[AgentDefinition, ...]:
-    """ビルトインエージェントのタプル。"""
-    return builtin_result.agents
+    try:
+        return by_name[name]
+    except KeyError:
+        raise AssertionError(f"Agent '{name}' not found in {sorted(by_name)}") from None
 
 
 # =============================================================================
@@ -124,64 +173,46 @@ def builtin_agents(builtin_result: LoadResult) -> tuple[AgentDefinition, ...]:
 class TestLoadSingleAgentValid:
     """_load_single_agent の正常系を検証。"""
 
-    def test_returns_agent_definition(self, tmp_path: Path) -> None:
+    def test_returns_agent_definition(self, valid_agent_toml: Path) -> None:
         """正常な TOML から AgentDefinition が返される。"""
-        path = _write_toml(tmp_path, "test-agent.toml", VALID_TOML)
-        result = _load_single_agent(path)
+        result = _load_single_agent(valid_agent_toml)
         assert isinstance(result, AgentDefinition)
 
-    def test_fields_match_toml_content(self, tmp_path: Path) -> None:
+    def test_fields_match_toml_content(self, valid_agent_toml: Path) -> None:
         """返された AgentDefinition の各フィールドが TOML の値と一致する。"""
-        path = _write_toml(tmp_path, "test-agent.toml", VALID_TOML)
-        agent = _load_single_agent(path)
+        agent = _load_single_agent(valid_agent_toml)
         assert agent.name == "test-agent"
         assert agent.description == "A test agent"
         assert agent.model == "anthropic:claude-opus-4-7"
         assert agent.output_schema == "scored_issues"
         assert agent.system_prompt == "You are a test agent."
 
-    def test_applicability_section_parsed(self, tmp_path: Path) -> None:
+    def test_applicability_section_parsed(self, tmp_path_ram: Path) -> None:
         """[applicability] セクション付き TOML が正しくパースされる。"""
-        toml_content = (
-            VALID_TOML
-            + """\
-
-[applicability]
-file_patterns = ["*.py", "*.ts"]
-content_patterns = ["class\\\\s+\\\\w+"]
-"""
-        )
-        path = _write_toml(tmp_path, "with-applicability.toml", toml_content)
+        path = _write_toml(tmp_path_ram, "with-applicability.toml", APPLICABILITY_TOML)
         agent = _load_single_agent(path)
         assert agent.applicability.file_patterns == ("*.py", "*.ts")
         assert agent.applicability.content_patterns == (r"class\s+\w+",)
 
-    def test_allowed_tools_parsed(self, tmp_path: Path) -> None:
+    def test_allowed_tools_parsed(self, tmp_path_ram: Path) -> None:
         """allowed_tools がタプルとして保持される。"""
-        toml_content = VALID_TOML.replace(
-            'system_prompt = "You are a test agent."',
-            'system_prompt = "You are a test agent."\nallowed_tools = ["git_read", "file_read"]',
-        )
-        path = _write_toml(tmp_path, "with-tools.toml", toml_content)
+        path = _write_toml(tmp_path_ram, "with-tools.toml", WITH_TOOLS_TOML)
         agent = _load_single_agent(path)
         assert agent.allowed_tools == ("git_read", "file_read")
 
-    def test_default_applicability_always_true(self, tmp_path: Path) -> None:
+    def test_default_applicability_always_true(self, valid_agent_toml: Path) -> None:
         """applicability 未指定時はデフォルトで always=True。"""
-        path = _write_toml(tmp_path, "default-app.toml", VALID_TOML)
-        agent = _load_single_agent(path)
+        agent = _load_single_agent(valid_agent_toml)
         assert agent.applicability.always is True
 
-    def test_default_phase_main(self, tmp_path: Path) -> None:
+    def test_default_phase_main(self, valid_agent_toml: Path) -> None:
         """phase 未指定時はデフォルトで main。"""
-        path = _write_toml(tmp_path, "default-phase.toml", VALID_TOML)
-        agent = _load_single_agent(path)
+        agent = _load_single_agent(valid_agent_toml)
         assert agent.phase == Phase.MAIN
 
-    def test_explicit_phase_parsed(self, tmp_path: Path) -> None:
+    def test_explicit_phase_parsed(self, tmp_path_ram: Path) -> None:
         """phase 指定が正しくパースされる。"""
-        toml_content = VALID_TOML + 'phase = "early"\n'
-        path = _write_toml(tmp_path, "with-phase.toml", toml_content)
+        path = _write_toml(tmp_path_ram, "with-phase.toml", WITH_PHASE_TOML)
         agent = _load_single_agent(path)
         assert agent.phase == Phase.EARLY
 
@@ -194,35 +225,35 @@ content_patterns = ["class\\\\s+\\\\w+"]
 class TestLoadSingleAgentErrors:
     """_load_single_agent のエラー系を検証。"""
 
-    def test_invalid_toml_syntax_raises(self, tmp_path: Path) -> None:
+    def test_invalid_toml_syntax_raises(self, tmp_path_ram: Path) -> None:
         """不正な TOML 構文で TOMLDecodeError が送出される。"""
-        path = _write_toml(tmp_path, "bad-syntax.toml", 'name = "unclosed')
+        path = _write_toml(tmp_path_ram, "bad-syntax.toml", 'name = "unclosed')
         with pytest.raises(tomllib.TOMLDecodeError):
             _load_single_agent(path)
 
     def test_missing_required_field_raises_validation_error(
-        self, tmp_path: Path
+        self, tmp_path_ram: Path
     ) -> None:
         """必須フィールド欠損で ValidationError が送出される。"""
         incomplete_toml = """\
 name = "test-agent"
 description = "A test agent"
 """
-        path = _write_toml(tmp_path, "incomplete.toml", incomplete_toml)
+        path = _write_toml(tmp_path_ram, "incomplete.toml", incomplete_toml)
         with pytest.raises(ValidationError):
             _load_single_agent(path)
 
-    def test_unknown_schema_raises_validation_error(self, tmp_path: Path) -> None:
+    def test_unknown_schema_raises_validation_error(self, tmp_path_ram: Path) -> None:
         """存在しない output_schema で ValidationError が送出される。"""
         bad_schema_toml = VALID_TOML.replace("scored_issues", "nonexistent")
-        path = _write_toml(tmp_path, "bad-schema.toml", bad_schema_toml)
+        path = _write_toml(tmp_path_ram, "bad-schema.toml", bad_schema_toml)
         with pytest.raises(ValidationError, match="not registered"):
             _load_single_agent(path)
 
-    def test_file_not_found_raises(self, tmp_path: Path) -> None:
+    def test_file_not_found_raises(self, tmp_path_ram: Path) -> None:
         """存在しないパスで FileNotFoundError が送出される。"""
         with pytest.raises(FileNotFoundError):
-            _load_single_agent(tmp_path / "nonexistent.toml")
+            _load_single_agent(tmp_path_ram / "nonexistent.toml")
 
 
 # =============================================================================
@@ -243,17 +274,18 @@ class TestLoadBuiltinAgents:
         """全ビルトインエージェントが読み込まれる。"""
         assert len(builtin_agents) == len(BUILTIN_AGENT_NAMES)
 
-    def test_all_agent_names_present(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
+    def test_all_agent_names_present(self, builtin_names: frozenset[str]) -> None:
         """全ての名前が存在する。"""
-        loaded_names = {agent.name for agent in builtin_agents}
-        assert loaded_names == BUILTIN_AGENT_NAMES
+        assert builtin_names == BUILTIN_AGENT_NAMES
 
     def test_no_errors(self, builtin_result: LoadResult) -> None:
         """errors が空タプルである。"""
         assert builtin_result.errors == ()
 
+    def test_result_is_cached(self) -> None:
+        """2回目以降の呼び出しはキャッシュ済みの同一インスタンスを返す。"""
+        assert load_builtin_agents() is load_builtin_agents()
+
     def test_all_agents_are_agent_definition(
         self, builtin_agents: tuple[AgentDefinition, ...]
     ) -> None:
@@ -277,236 +309,123 @@ class TestLoadBuiltinAgents:
 
 
 # =============================================================================
-# T014: load_builtin_agents — エラー収集パスの検証
+# T015: ビルトインエージェント — output_schema / phase / applicability 検証
 # =============================================================================
 
 
-class TestLoadBuiltinAgentsErrorCollection:
-    """load_builtin_agents のエラー収集パスを検証。"""
-
-    @staticmethod
-    def _load_builtin_with_failure(target_name: str, error: Exception) -> LoadResult:
-        """指定名のエージェント読み込み時に例外を発生させてビルトインを読み込む。"""
-        original = _load_single_agent
-
-        def _failing_loader(path: Path) -> AgentDefinition:
-            if target_name in str(path):
-                raise error
-            return original(path)
-
-        with patch(
-            "hachimoku.agents.loader._load_single_agent",
-            side_effect=_failing_loader,
-        ):
-            return load_builtin_agents()
-
-    def test_error_collected_in_load_result(self) -> None:
-        """_load_single_agent の例外が LoadResult.errors に収集される。"""
-        result = self._load_builtin_with_failure(
-            "code-reviewer",
-            ValidationError.from_exception_data(
-                title="AgentDefinition", line_errors=[]
-            ),
-        )
-        assert len(result.errors) == 1
-        assert "code-reviewer.toml" in result.errors[0].source
-
-    def test_error_source_contains_filename(self) -> None:
-        """LoadError.source にファイル名が設定される。"""
-        result = self._load_builtin_with_failure(
-            "pr-test-analyzer", OSError("mock file error")
-        )
-        assert len(result.errors) == 1
-        assert result.errors[0].source == "pr-test-analyzer.toml"
-
-    def test_error_message_includes_type_name(self) -> None:
-        """LoadError.message に例外型名が含まれる。"""
-        result = self._load_builtin_with_failure(
-            "comment-analyzer", OSError("bad file access")
-        )
-        assert len(result.errors) == 1
-        assert "OSError" in result.errors[0].message
-
-    def test_one_error_does_not_block_others(self) -> None:
-        """1ファイルの失敗が他ファイルの読み込みを妨げない。"""
-        result = self._load_builtin_with_failure(
-            "code-reviewer",
-            ValidationError.from_exception_data(
-                title="AgentDefinition", line_errors=[]
-            ),
-        )
-        assert len(result.agents) == len(BUILTIN_AGENT_NAMES) - 1
-        assert len(result.errors) == 1
-        loaded_names = {agent.name for agent in result.agents}
-        assert "code-reviewer" not in loaded_names
-
+class _BuiltinExpectation(NamedTuple):
+    """ビルトインエージェントの期待値。"""
 
-# =============================================================================
-# T015: ビルトインエージェント — output_schema 検証
-# =============================================================================
+    output_schema: str
+    phase: Phase
+    always: bool
+    has_file_patterns: bool
+    has_content_patterns: bool
 
 
-class TestBuiltinAgentSchemas:
-    """各ビルトインエージェントの output_schema を検証。"""
-
-    @pytest.mark.parametrize(
-        ("agent_name", "expected_schema"),
-        [
-            ("architecture-reviewer", "severity_classified"),
-            ("breaking-change-detector", "severity_classified"),
-            ("code-reviewer", "scored_issues"),
-            ("code-simplifier", "improvement_suggestions"),
-            ("comment-analyzer", "category_classification"),
-            ("dependency-auditor", "severity_classified"),
-            ("performance-analyzer", "severity_classified"),
-            ("plan-reviewer", "scored_issues"),
-            ("pr-test-analyzer", "test_gap_assessment"),
-            ("security-analyzer", "severity_classified"),
-            ("silent-failure-hunter", "severity_classified"),
-            ("type-design-analyzer", "multi_dimensional_analysis"),
-        ],
-    )
-    def test_output_schema(
-        self,
-        builtin_agents: tuple[AgentDefinition, ...],
-        agent_name: str,
-        expected_schema: str,
-    ) -> None:
-        agent = _find_agent(builtin_agents, agent_name)
-        assert agent.output_schema == expected_schema
+_BUILTIN_EXPECTATIONS: Final[Mapping[str, _BuiltinExpectation]] = MappingProxyType(
+    {
+        "architecture-reviewer": _BuiltinExpectation(
+            "severity_classified", Phase.MAIN, False, False, True
+        ),
+        "breaking-change-detector": _BuiltinExpectation(
+            "severity_classified", Phase.MAIN, False, False, True
+        ),
+        "code-reviewer": _BuiltinExpectation(
+            "scored_issues", Phase.MAIN, True, False, False
+        ),
+        "code-simplifier": _BuiltinExpectation(
+            "improvement_suggestions", Phase.FINAL, True, False, False
+        ),
+        "comment-analyzer": _BuiltinExpectation(
+            "category_classification", Phase.FINAL, False, False, True
+        ),
+        "dependency-auditor": _BuiltinExpectation(
+            "severity_classified", Phase.MAIN, False, False, True
+        ),
+        "performance-analyzer": _BuiltinExpectation(
+            "severity_classified", Phase.MAIN, False, False, True
+        ),
+        "plan-reviewer": _BuiltinExpectation(
+            "scored_issues", Phase.MAIN, False, True, True
+        ),
+        "pr-test-analyzer": _BuiltinExpectation(
+            "test_gap_assessment", Phase.MAIN, False, True, False
+        ),
+        "security-analyzer": _BuiltinExpectation(
+            "severity_classified", Phase.MAIN, False, False, True
+        ),
+        "silent-failure-hunter": _BuiltinExpectation(
+            "severity_classified", Phase.MAIN, False, False, True
+        ),
+        "type-design-analyzer": _BuiltinExpectation(
+            "multi_dimensional_analysis", Phase.MAIN, False, True, True
+        ),
+    }
+)
+"""ビルトインエージェント名から期待値への対応表。"""
 
 
-# =============================================================================
-# T015: ビルトインエージェント — phase 検証
-# =============================================================================
+class TestBuiltinAgentInvariants:
+    """各ビルトインエージェントの output_schema / phase / applicability を1回の走査で検証。"""
 
+    def test_expectations_cover_all_builtin_agents(self) -> None:
+        """期待値表が全ビルトインエージェントを網羅する。"""
+        assert _BUILTIN_EXPECTATIONS.keys() == BUILTIN_AGENT_NAMES
 
-class TestBuiltinAgentPhases:
-    """各ビルトインエージェントの phase を検証。"""
-
-    @pytest.mark.parametrize(
-        ("agent_name", "expected_phase"),
-        [
-            ("architecture-reviewer", Phase.MAIN),
-            ("breaking-change-detector", Phase.MAIN),
-            ("code-reviewer", Phase.MAIN),
-            ("code-simplifier", Phase.FINAL),
-            ("comment-analyzer", Phase.FINAL),
-            ("dependency-auditor", Phase.MAIN),
-            ("performance-analyzer", Phase.MAIN),
-            ("plan-reviewer", Phase.MAIN),
-            ("pr-test-analyzer", Phase.MAIN),
-            ("security-analyzer", Phase.MAIN),
-            ("silent-failure-hunter", Phase.MAIN),
-            ("type-design-analyzer", Phase.MAIN),
-        ],
-    )
-    def test_phase(
-        self,
-        builtin_agents: tuple[AgentDefinition, ...],
-        agent_name: str,
-        expected_phase: Phase,
+    def test_builtin_agent_invariants(
+        self, builtin_agents_by_name: Mapping[str, AgentDefinition]
     ) -> None:
-        agent = _find_agent(builtin_agents, agent_name)
-        assert agent.phase == expected_phase
+        """全ビルトインエージェントが期待値表と一致する。不一致はエージェント名付きで列挙する。"""
+        mismatches: list[str] = []
+        for name, expected in _BUILTIN_EXPECTATIONS.items():
+            agent = builtin_agents_by_name[name]
+            rule = agent.applicability
+            actual = _BuiltinExpectation(
+                output_schema=agent.output_schema,
+                phase=agent.phase,
+                always=rule.always,
+                has_file_patterns=len(rule.file_patterns) > 0,
+                has_content_patterns=len(rule.content_patterns) > 0,
+            )
+            if actual != expected:
+                mismatches.append(f"{name}: expected {expected}, got {actual}")
+        assert not mismatches, "\n".join(mismatches)
 
 
 # =============================================================================
-# T015: ビルトインエージェント — applicability 検証
+# T030: load_custom_agents
 # =============================================================================
 
 
-class TestBuiltinAgentApplicability:
-    """各ビルトインエージェントの applicability を検証。"""
-
-    def test_code_reviewer_always_true(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "code-reviewer")
-        assert agent.applicability.always is True
-
-    def test_silent_failure_hunter_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "silent-failure-hunter")
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_pr_test_analyzer_has_file_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "pr-test-analyzer")
-        assert len(agent.applicability.file_patterns) > 0
-
-    def test_type_design_analyzer_has_file_and_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "type-design-analyzer")
-        assert len(agent.applicability.file_patterns) > 0
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_comment_analyzer_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "comment-analyzer")
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_code_simplifier_always_true(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "code-simplifier")
-        assert agent.applicability.always is True
-
-    def test_architecture_reviewer_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "architecture-reviewer")
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_performance_analyzer_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "performance-analyzer")
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_plan_reviewer_has_file_and_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "plan-reviewer")
-        assert agent.applicability.always is False
-        assert len(agent.applicability.file_patterns) > 0
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_breaking_change_detector_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "breaking-change-detector")
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_dependency_auditor_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "dependency-auditor")
-        assert len(agent.applicability.content_patterns) > 0
-
-    def test_security_analyzer_has_content_patterns(
-        self, builtin_agents: tuple[AgentDefinition, ...]
-    ) -> None:
-        agent = _find_agent(builtin_agents, "security-analyzer")
-        assert len(agent.applicability.content_patterns) > 0
-
-
-# =============================================================================
-# T030: load_custom_agents
-# =============================================================================
+@pytest.fixture(scope="class")
+def valid_custom_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """正常なカスタム定義1件を置いた読み込み専用ディレクトリ。クラス単位で共有する。"""
+    custom_dir = tmp_path_factory.mktemp("valid_custom")
+    _write_toml(custom_dir, "custom-agent.toml", VALID_TOML_BYTES)
+    return custom_dir
+
+
+@pytest.fixture(scope="class")
+def multi_custom_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """正常なカスタム定義2件を置いた読み込み専用ディレクトリ。クラス単位で共有する。"""
+    custom_dir = tmp_path_factory.mktemp("multi_custom")
+    _write_many(
+        custom_dir,
+        {
+            "custom-one.toml": VALID_TOML.replace("test-agent", "custom-one"),
+            "custom-two.toml": VALID_TOML.replace("test-agent", "custom-two"),
+        },
+    )
+    return custom_dir
 
 
 class TestLoadCustomAgents:
     """load_custom_agents のテストを検証。"""
 
-    def test_loads_valid_custom_agent(self, tmp_path: Path) -> None:
+    def test_loads_valid_custom_agent(self, valid_custom_dir: Path) -> None:
         """正常なカスタム定義が読み込まれる。"""
-        _write_toml(tmp_path, "custom-agent.toml", VALID_TOML)
-        result = load_custom_agents(tmp_path)
+        result = load_custom_agents(valid_custom_dir)
         assert len(result.agents) == 1
         assert result.agents[0].name == "test-agent"
 
@@ -518,17 +437,24 @@ class TestLoadCustomAgents:
 
     def test_ignores_non_toml_files(self, tmp_path: Path) -> None:
         """.toml 以外のファイルは無視される。"""
-        _write_toml(tmp_path, "custom-agent.toml", VALID_TOML)
-        (tmp_path / "readme.txt").write_text("not a toml file")
-        (tmp_path / "script.py").write_text("print('hello')")
+        _write_many(
+            tmp_path,
+            {
+                "custom-agent.toml": VALID_TOML_BYTES,
+                "readme.txt": "not a toml file",
+                "script.py": "print('hello')",
+            },
+        )
         result = load_custom_agents(tmp_path)
         assert len(result.agents) == 1
         assert result.errors == ()
 
     def test_partial_failure_collects_error(self, tmp_path: Path) -> None:
         """不正な TOML がある場合、他の正常定義は読み込まれエラーが収集される。"""
-        _write_toml(tmp_path, "good-agent.toml", VALID_TOML)
-        _write_toml(tmp_path, "bad-agent.toml", 'name = "unclosed')
+        _write_many(
+            tmp_path,
+            {"good-agent.toml": VALID_TOML_BYTES, "bad-agent.toml": 'name = "unclosed'},
+        )
         result = load_custom_agents(tmp_path)
         assert len(result.agents) == 1
         assert len(result.errors) == 1
@@ -569,17 +495,26 @@ class TestLoadCustomAgents:
         result = load_custom_agents(tmp_path)
         assert "TOMLDecodeError" in result.errors[0].message
 
-    def test_multiple_valid_custom_agents(self, tmp_path: Path) -> None:
+    def test_multiple_valid_custom_agents(self, multi_custom_dir: Path) -> None:
         """複数の正常カスタム定義が全件読み込まれる。"""
-        agent1 = VALID_TOML.replace("test-agent", "custom-one")
-        agent2 = VALID_TOML.replace("test-agent", "custom-two")
-        _write_toml(tmp_path, "custom-one.toml", agent1)
-        _write_toml(tmp_path, "custom-two.toml", agent2)
-        result = load_custom_agents(tmp_path)
+        result = load_custom_agents(multi_custom_dir)
         assert len(result.agents) == 2
         loaded_names = {a.name for a in result.agents}
         assert loaded_names == {"custom-one", "custom-two"}
 
+    def test_results_ordered_by_filename(self, tmp_path: Path) -> None:
+        """並行読み込みでも agents と errors はファイル名順に並ぶ。"""
+        names = ("d-agent", "a-agent", "c-agent", "b-agent")
+        files: dict[str, str | bytes] = {
+            f"{name}.toml": VALID_TOML.replace("test-agent", name) for name in names
+        }
+        files["bad-2.toml"] = 'name = "unclosed'
+        files["bad-1.toml"] = 'name = "unclosed'
+        _write_many(tmp_path, files)
+        result = load_custom_agents(tmp_path)
+        assert [a.name for a in result.agents] == sorted(names)
+        assert [e.source for e in result.errors] == ["bad-1.toml", "bad-2.toml"]
+
 
 # =============================================================================
 # T031: load_agents — 統合テスト
@@ -596,23 +531,21 @@ class TestLoadAgents:
         loaded_names = {a.name for a in result.agents}
         assert loaded_names == BUILTIN_AGENT_NAMES
 
-    def test_custom_added_to_builtin(self, tmp_path: Path) -> None:
+    def test_custom_added_to_builtin(
+        self, tmp_path: Path, builtin_names: frozenset[str]
+    ) -> None:
         """新名前のカスタムがビルトインに追加される。"""
-        _write_toml(tmp_path, "my-custom.toml", VALID_TOML)
+        _write_toml(tmp_path, "my-custom.toml", VALID_TOML_BYTES)
         result = load_agents(custom_dir=tmp_path)
-        assert len(result.agents) == len(BUILTIN_AGENT_NAMES) + 1
-        loaded_names = {a.name for a in result.agents}
-        assert "test-agent" in loaded_names
-        assert BUILTIN_AGENT_NAMES.issubset(loaded_names)
+        assert len(result.agents) == len(builtin_names) + 1
+        loaded_names = frozenset(a.name for a in result.agents)
+        assert loaded_names - builtin_names == {"test-agent"}
 
     def test_custom_overrides_builtin(self, tmp_path: Path) -> None:
         """同名のカスタムがビルトインを上書きする。"""
-        override_toml = VALID_TOML.replace("test-agent", "code-reviewer").replace(
-            "A test agent", "Custom code reviewer"
-        )
-        _write_toml(tmp_path, "code-reviewer.toml", override_toml)
+        _write_toml(tmp_path, "code-reviewer.toml", OVERRIDE_TOML)
         result = load_agents(custom_dir=tmp_path)
-        agent = _find_agent(result.agents, "code-reviewer")
+        agent = _find_agent({a.name: a for a in result.agents}, "code-reviewer")
         assert agent.description == "Custom code reviewer"
         assert len(result.agents) == len(BUILTIN_AGENT_NAMES)
 
@@ -620,7 +553,7 @@ class TestLoadAgents:
         """不正なカスタムが同名ビルトインを上書きしない。"""
         _write_toml(tmp_path, "code-reviewer.toml", 'name = "unclosed')
         result = load_agents(custom_dir=tmp_path)
-        agent = _find_agent(result.agents, "code-reviewer")
+        agent = _find_agent({a.name: a for a in result.agents}, "code-reviewer")
         assert (
             agent.description
             == "Comprehensive review of code quality, bugs, and best practices"
@@ -640,21 +573,17 @@ class TestLoadAgents:
 # =============================================================================
 
 
+EXPECTED_BUILTIN_TOOLS: Final[tuple[str, ...]] = ("git_read", "gh_read", "file_read")
+"""全ビルトインエージェントに共通する allowed_tools。"""
+
+
 class TestBuiltinAgentAllowedTools:
     """各ビルトインエージェントの allowed_tools を検証。"""
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
-    def test_allowed_tools(
-        self,
-        builtin_agents: tuple[AgentDefinition, ...],
-        agent_name: str,
-    ) -> None:
+    @pytest.mark.parametrize("agent", SORTED_BUILTIN_AGENT_NAMES, indirect=True)
+    def test_allowed_tools(self, agent: AgentDefinition) -> None:
         """全ビルトインエージェントが git_read, gh_read, file_read を持つ。"""
-        agent = _find_agent(builtin_agents, agent_name)
-        assert agent.allowed_tools == ("git_read", "gh_read", "file_read")
+        assert agent.allowed_tools == EXPECTED_BUILTIN_TOOLS
 
 
 # =============================================================================
@@ -662,106 +591,102 @@ class TestBuiltinAgentAllowedTools:
 # =============================================================================
 
 
+class _PromptStats(NamedTuple):
+    """system_prompt の構造検証用に事前計算した値。"""
+
+    lowered: str
+    has_backslash: bool
+    filtering_section: str
+    filtering_section_lower: str
+
+
+@pytest.fixture(scope="session")
+def builtin_prompt_stats(
+    builtin_agents: tuple[AgentDefinition, ...],
+) -> Mapping[str, _PromptStats]:
+    """エージェント名から _PromptStats への対応表。セッション内で1回だけ計算。"""
+    stats: dict[str, _PromptStats] = {}
+    for agent in builtin_agents:
+        section = _get_self_filtering_section(agent.system_prompt)
+        stats[agent.name] = _PromptStats(
+            lowered=agent.system_prompt.lower(),
+            has_backslash="\\" in agent.system_prompt,
+            filtering_section=section,
+            filtering_section_lower=section.lower(),
+        )
+    return MappingProxyType(stats)
+
+
 class TestBuiltinAgentSystemPromptStructure:
     """各ビルトインエージェントの system_prompt の構造的制約を検証。"""
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
+    @pytest.mark.parametrize("agent_name", SORTED_BUILTIN_AGENT_NAMES)
     def test_system_prompt_contains_agent_name_reference(
         self,
-        builtin_agents: tuple[AgentDefinition, ...],
+        builtin_prompt_stats: Mapping[str, _PromptStats],
         agent_name: str,
     ) -> None:
         """system_prompt にエージェント名への言及を含む。"""
-        agent = _find_agent(builtin_agents, agent_name)
-        prompt_lower = agent.system_prompt.lower()
-        assert agent_name in prompt_lower, (
+        assert agent_name in builtin_prompt_stats[agent_name].lowered, (
             f"{agent_name}: system_prompt does not reference agent name"
         )
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
+    @pytest.mark.parametrize("agent_name", SORTED_BUILTIN_AGENT_NAMES)
     def test_system_prompt_no_backslash(
         self,
-        builtin_agents: tuple[AgentDefinition, ...],
+        builtin_prompt_stats: Mapping[str, _PromptStats],
         agent_name: str,
     ) -> None:
         r"""system_prompt にバックスラッシュを含まない（TOML パース安全性）。"""
-        agent = _find_agent(builtin_agents, agent_name)
-        assert "\\" not in agent.system_prompt, (
+        assert not builtin_prompt_stats[agent_name].has_backslash, (
             f"{agent_name}: system_prompt contains backslash"
         )
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
+    @pytest.mark.parametrize("agent", SORTED_BUILTIN_AGENT_NAMES, indirect=True)
     def test_system_prompt_contains_confidence_filtering_section(
-        self,
-        builtin_agents: tuple[AgentDefinition, ...],
-        agent_name: str,
+        self, agent: AgentDefinition
     ) -> None:
         """system_prompt に Confidence Filtering セクションを含む。"""
-        agent = _find_agent(builtin_agents, agent_name)
         assert "## Confidence Filtering" in agent.system_prompt, (
-            f"{agent_name}: system_prompt does not contain Confidence Filtering section"
+            f"{agent.name}: system_prompt does not contain Confidence Filtering section"
         )
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
+    @pytest.mark.parametrize("agent_name", SORTED_BUILTIN_AGENT_NAMES)
     def test_system_prompt_contains_evidence_verification_gate(
         self,
-        builtin_agents: tuple[AgentDefinition, ...],
+        builtin_prompt_stats: Mapping[str, _PromptStats],
         agent_name: str,
     ) -> None:
         """system_prompt の Self-Filtering Rules に証拠確認ゲートを含む。"""
-        filtering_section = _get_self_filtering_section(
-            _find_agent(builtin_agents, agent_name).system_prompt
-        )
+        filtering_section = builtin_prompt_stats[agent_name].filtering_section
         assert "read_file" in filtering_section, (
             f"{agent_name}: Self-Filtering Rules does not contain evidence "
             f"verification gate (must reference read_file)"
         )
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
+    @pytest.mark.parametrize("agent_name", SORTED_BUILTIN_AGENT_NAMES)
     def test_system_prompt_contains_red_flag_language_prohibition(
         self,
-        builtin_agents: tuple[AgentDefinition, ...],
+        builtin_prompt_stats: Mapping[str, _PromptStats],
         agent_name: str,
     ) -> None:
         """system_prompt の Self-Filtering Rules に Red Flag 言語の禁止を含む。"""
-        filtering_section = _get_self_filtering_section(
-            _find_agent(builtin_agents, agent_name).system_prompt
-        )
+        section_lower = builtin_prompt_stats[agent_name].filtering_section_lower
         for keyword in ("should", "probably", "might"):
-            assert keyword in filtering_section.lower(), (
+            assert keyword in section_lower, (
                 f"{agent_name}: Self-Filtering Rules does not prohibit "
                 f"red flag language (missing '{keyword}')"
             )
 
-    @pytest.mark.parametrize(
-        "agent_name",
-        sorted(BUILTIN_AGENT_NAMES),
-    )
+    @pytest.mark.parametrize("agent_name", SORTED_BUILTIN_AGENT_NAMES)
     def test_system_prompt_contains_yagni_check(
         self,
-        builtin_agents: tuple[AgentDefinition, ...],
+        builtin_prompt_stats: Mapping[str, _PromptStats],
         agent_name: str,
     ) -> None:
         """system_prompt の Self-Filtering Rules に YAGNI チェックを含む。"""
-        filtering_section = _get_self_filtering_section(
-            _find_agent(builtin_agents, agent_name).system_prompt
-        )
-        assert "future" in filtering_section.lower(), (
+        section_lower = builtin_prompt_stats[agent_name].filtering_section_lower
+        assert "future" in section_lower, (
             f"{agent_name}: Self-Filtering Rules does not contain YAGNI check"
         )
 
@@ -775,9 +700,11 @@ class TestSecurityAnalyzerPromptSections:
     """security-analyzer の system_prompt に Issue #320 で追加されたセクションを検証。"""
 
     @pytest.fixture()
-    def security_prompt(self, builtin_agents: tuple[AgentDefinition, ...]) -> str:
+    def security_prompt(
+        self, builtin_agents_by_name: Mapping[str, AgentDefinition]
+    ) -> str:
         """security-analyzer の system_prompt を返す。"""
-        agent = _find_agent(builtin_agents, "security-analyzer")
+        agent = builtin_agents_by_name["security-analyzer"]
         return agent.system_prompt
 
     def test_contains_exploitability_verification_section(
@@ -848,6 +775,9 @@ allowed_tools = ["git_read", "gh_read", "file_read"]
 system_prompt = "You are an agent selector."
 """
 
+VALID_SELECTOR_TOML_BYTES = VALID_SELECTOR_TOML.encode("utf-8")
+"""VALID_SELECTOR_TOML の UTF-8 エンコード済みバイト列。"""
+
 
 # =============================================================================
 # T-118-002: load_builtin_selector
@@ -857,31 +787,32 @@ system_prompt = "You are an agent selector."
 class TestLoadBuiltinSelector:
     """load_builtin_selector のテストを検証。"""
 
-    def test_returns_selector_definition(self) -> None:
+    def test_returns_selector_definition(
+        self, builtin_selector: SelectorDefinition
+    ) -> None:
         """戻り値が SelectorDefinition インスタンスである。"""
-        result = load_builtin_selector()
-        assert isinstance(result, SelectorDefinition)
+        assert isinstance(builtin_selector, SelectorDefinition)
 
-    def test_name_is_selector(self) -> None:
+    def test_name_is_selector(self, builtin_selector: SelectorDefinition) -> None:
         """ビルトインセレクターの name が "selector" である。"""
-        result = load_builtin_selector()
-        assert result.name == "selector"
+        assert builtin_selector.name == "selector"
 
-    def test_system_prompt_non_empty(self) -> None:
+    def test_system_prompt_non_empty(
+        self, builtin_selector: SelectorDefinition
+    ) -> None:
         """ビルトインセレクターの system_prompt が空でない。"""
-        result = load_builtin_selector()
-        assert len(result.system_prompt.strip()) > 0
+        assert len(builtin_selector.system_prompt.strip()) > 0
 
-    def test_allowed_tools_non_empty(self) -> None:
+    def test_allowed_tools_non_empty(
+        self, builtin_selector: SelectorDefinition
+    ) -> None:
         """ビルトインセレクターの allowed_tools が空でない。"""
-        result = load_builtin_selector()
-        assert len(result.allowed_tools) > 0
+        assert len(builtin_selector.allowed_tools) > 0
 
-    def test_model_is_set(self) -> None:
+    def test_model_is_set(self, builtin_selector: SelectorDefinition) -> None:
         """ビルトインセレクターの model が設定されている。"""
-        result = load_builtin_selector()
-        assert result.model is not None
-        assert len(result.model) > 0
+        assert builtin_selector.model is not None
+        assert len(builtin_selector.model) > 0
 
 
 # =============================================================================
@@ -909,7 +840,7 @@ class TestLoadSelector:
 
     def test_builtin_used_when_no_custom_selector(self, tmp_path: Path) -> None:
         """カスタムディレクトリに selector.toml がない場合はビルトインが使用される。"""
-        _write_toml(tmp_path, "other-agent.toml", VALID_TOML)
+        _write_toml(tmp_path, "other-agent.toml", VALID_TOML_BYTES)
         result = load_selector(custom_dir=tmp_path)
         assert result.name == "selector"
         assert result.description != "A test agent"
@@ -953,11 +884,11 @@ class TestLoadSelector:
 class TestLoadBuiltinAgentsExcludesSelector:
     """load_builtin_agents の結果にセレクターが含まれないことを検証。"""
 
-    def test_selector_not_in_builtin_agents(self) -> None:
+    def test_selector_not_in_builtin_agents(
+        self, builtin_names: frozenset[str]
+    ) -> None:
         """ビルトインエージェントリストに "selector" が含まれない。"""
-        result = load_builtin_agents()
-        agent_names = {a.name for a in result.agents}
-        assert "selector" not in agent_names
+        assert "selector" not in builtin_names
 
 
 class TestLoadCustomAgentsExcludesSelector:
@@ -965,8 +896,13 @@ class TestLoadCustomAgentsExcludesSelector:
 
     def test_selector_excluded_from_custom_agents(self, tmp_path: Path) -> None:
         """カスタムディレクトリの selector.toml がエージェントリストに含まれない。"""
-        _write_toml(tmp_path, "selector.toml", VALID_SELECTOR_TOML)
-        _write_toml(tmp_path, "custom-agent.toml", VALID_TOML)
+        _write_many(
+            tmp_path,
+            {
+                "selector.toml": VALID_SELECTOR_TOML_BYTES,
+                "custom-agent.toml": VALID_TOML_BYTES,
+            },
+        )
         result = load_custom_agents(tmp_path)
         agent_names = {a.name for a in result.agents}
         assert "selector" not in agent_names
@@ -978,7 +914,7 @@ class TestLoadAgentsExcludesSelector:
 
     def test_selector_excluded_from_merged_agents(self, tmp_path: Path) -> None:
         """統合結果にセレクターが含まれない。"""
-        _write_toml(tmp_path, "selector.toml", VALID_SELECTOR_TOML)
+        _write_toml(tmp_path, "selector.toml", VALID_SELECTOR_TOML_BYTES)
         result = load_agents(custom_dir=tmp_path)
         agent_names = {a.name for a in result.agents}
         assert "selector" not in agent_names
@@ -995,6 +931,9 @@ model = "claudecode:claude-opus-4-7"
 system_prompt = "You are a review aggregator."
 """
 
+VALID_AGGREGATOR_TOML_BYTES = VALID_AGGREGATOR_TOML.encode("utf-8")
+"""VALID_AGGREGATOR_TOML の UTF-8 エンコード済みバイト列。"""
+
 
 # =============================================================================
 # load_builtin_aggregator
@@ -1051,7 +990,7 @@ class TestLoadAggregator:
 
     def test_builtin_used_when_no_custom_aggregator(self, tmp_path: Path) -> None:
         """カスタムディレクトリに aggregator.toml がない場合はビルトインが使用される。"""
-        _write_toml(tmp_path, "other-agent.toml", VALID_TOML)
+        _write_toml(tmp_path, "other-agent.toml", VALID_TOML_BYTES)
         result = load_aggregator(custom_dir=tmp_path)
         assert result.name == "aggregator"
 
@@ -1092,11 +1031,11 @@ class TestLoadAggregator:
 class TestLoadBuiltinAgentsExcludesAggregator:
     """load_builtin_agents の結果にアグリゲーターが含まれないことを検証。"""
 
-    def test_aggregator_not_in_builtin_agents(self) -> None:
+    def test_aggregator_not_in_builtin_agents(
+        self, builtin_names: frozenset[str]
+    ) -> None:
         """ビルトインエージェントリストに "aggregator" が含まれない。"""
-        result = load_builtin_agents()
-        agent_names = {a.name for a in result.agents}
-        assert "aggregator" not in agent_names
+        assert "aggregator" not in builtin_names
 
 
 class TestLoadCustomAgentsExcludesAggregator:
@@ -1104,8 +1043,13 @@ class TestLoadCustomAgentsExcludesAggregator:
 
     def test_aggregator_excluded_from_custom_agents(self, tmp_path: Path) -> None:
         """カスタムディレクトリの aggregator.toml がエージェントリストに含まれない。"""
-        _write_toml(tmp_path, "aggregator.toml", VALID_AGGREGATOR_TOML)
-        _write_toml(tmp_path, "custom-agent.toml", VALID_TOML)
+        _write_many(
+            tmp_path,
+            {
+                "aggregator.toml": VALID_AGGREGATOR_TOML_BYTES,
+                "custom-agent.toml": VALID_TOML_BYTES,
+            },
+        )
         result = load_custom_agents(tmp_path)
         agent_names = {a.name for a in result.agents}
         assert "aggregator" not in agent_names
@@ -1117,7 +1061,7 @@ class TestLoadAgentsExcludesAggregator:
 
     def test_aggregator_excluded_from_merged_agents(self, tmp_path: Path) -> None:
         """統合結果にアグリゲーターが含まれない。"""
-        _write_toml(tmp_path, "aggregator.toml", VALID_AGGREGATOR_TOML)
+        _write_toml(tmp_path, "aggregator.toml", VALID_AGGREGATOR_TOML_BYTES)
         result = load_agents(custom_dir=tmp_path)
         agent_names = {a.name for a in result.agents}
         assert "aggregator" not in agent_names
@@ -0,0 +1,95 @@
+"""load_builtin_agents のエラー収集パスのテスト。
+
+T014: load_builtin_agents — エラー収集パスの検証
+
+モジュール属性 _load_single_agent を差し替えるテストのため test_loader.py から分離している。
+pytest-xdist の --dist=loadfile で実行する場合も、差し替えを伴うテストは
+同一ワーカー上にまとまる。
+
+タスク参照: specs/003-agent-definition/tasks.md Phase 3
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from hachimoku.agents import loader as loader_module
+from hachimoku.agents.loader import _load_single_agent, load_builtin_agents
+from hachimoku.agents.models import AgentDefinition
+
+
+def _validation_error() -> ValidationError:
+    """フェイルフックが送出する ValidationError を生成する。"""
+    return ValidationError.from_exception_data(title="AgentDefinition", line_errors=[])
+
+
+def _os_error() -> OSError:
+    """フェイルフックが送出する OSError を生成する。"""
+    return OSError("mock file error")
+
+
+def _make_fail_hook(
+    target_name: str, make_error: Callable[[], Exception]
+) -> Callable[[Path], AgentDefinition]:
+    """指定名のエージェント読み込み時にのみ例外を送出する _load_single_agent 代替を返す。
+
+    例外インスタンスは送出のたびに make_error で生成し、
+    __traceback__ がテストケース間で共有・蓄積されないようにする。
+    """
+    original = _load_single_agent
+
+    def _failing_loader(path: Path) -> AgentDefinition:
+        if target_name in str(path):
+            raise make_error()
+        return original(path)
+
+    return _failing_loader
+
+
+class TestLoadBuiltinAgentsErrorCollection:
+    """load_builtin_agents のエラー収集パスを検証。"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_builtin_cache(self) -> Iterator[None]:
+        """差し替え前後でキャッシュを破棄し、差し替え結果が他テストへ漏れないようにする。"""
+        load_builtin_agents.cache_clear()
+        yield
+        load_builtin_agents.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("target_name", "make_error"),
+        [
+            pytest.param("code-reviewer", _validation_error, id="validation-error"),
+            pytest.param("pr-test-analyzer", _os_error, id="os-error"),
+            pytest.param("comment-analyzer", _os_error, id="os-error-other"),
+        ],
+    )
+    def test_error_collected_without_blocking_others(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        target_name: str,
+        make_error: Callable[[], Exception],
+        builtin_names: frozenset[str],
+    ) -> None:
+        """_load_single_agent の例外が LoadResult.errors に収集され、他は読み込まれる。
+
+        - LoadError.source にファイル名が設定される
+        - LoadError.message に例外型名が含まれる
+        - 1ファイルの失敗が他ファイルの読み込みを妨げない
+        """
+        monkeypatch.setattr(
+            loader_module,
+            "_load_single_agent",
+            _make_fail_hook(target_name, make_error),
+        )
+        result = load_builtin_agents()
+
+        assert len(result.errors) == 1
+        assert result.errors[0].source == f"{target_name}.toml"
+        assert type(make_error()).__name__ in result.errors[0].message
+        assert len(result.agents) == len(builtin_names) - 1
+        assert target_name not in {agent.name for agent in result.agents}
@@ -8,11 +8,17 @@ T007: LoadError / LoadResult — フィールドバリデーション、frozen
 T-118-001: SelectorDefinition — 全必須フィールド、name パターン、frozen、extra=forbid
 """
 
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Final
+
 import pytest
 from pydantic import ValidationError
 
 from hachimoku.agents.models import (
     AGENT_NAME_PATTERN,
+    AGENT_NAME_RE,
     PHASE_ORDER,
     AgentDefinition,
     AggregatorDefinition,
@@ -21,6 +27,8 @@ from hachimoku.agents.models import (
     LoadResult,
     Phase,
     SelectorDefinition,
+    _compile_pattern,
+    phase_key,
 )
 from hachimoku.models._base import HachimokuBaseModel
 from hachimoku.models.schemas import BaseAgentOutput, ScoredIssues
@@ -103,6 +111,20 @@ class TestPhaseOrder:
         assert sorted_phases == [Phase.EARLY, Phase.MAIN, Phase.FINAL]
 
 
+class TestPhaseKey:
+    """phase_key キー関数を検証。"""
+
+    @pytest.mark.parametrize("phase", list(Phase))
+    def test_matches_phase_order(self, phase: Phase) -> None:
+        """phase_key は PHASE_ORDER と同じ順序値を返す。"""
+        assert phase_key(phase) == PHASE_ORDER[phase]
+
+    def test_sorted_by_phase_key(self) -> None:
+        """phase_key でソートすると EARLY, MAIN, FINAL の順になる。"""
+        phases = [Phase.FINAL, Phase.EARLY, Phase.MAIN]
+        assert sorted(phases, key=phase_key) == [Phase.EARLY, Phase.MAIN, Phase.FINAL]
+
+
 # =============================================================================
 # ApplicabilityRule — 正常系
 # =============================================================================
@@ -138,6 +160,21 @@ class TestApplicabilityRuleValid:
         rule = ApplicabilityRule()
         assert isinstance(rule, HachimokuBaseModel)
 
+    def test_compiled_content_patterns(self) -> None:
+        r"""content_patterns がコンパイル済み re.Pattern として参照できる。"""
+        rule = ApplicabilityRule(content_patterns=(r"class\s+\w+", r"def\s+\w+"))
+        compiled = rule.compiled_content_patterns
+        assert all(isinstance(p, re.Pattern) for p in compiled)
+        assert tuple(p.pattern for p in compiled) == rule.content_patterns
+        assert rule.compiled_content_patterns is compiled
+
+    def test_compiled_content_patterns_excluded_from_serialization(self) -> None:
+        """compiled_content_patterns は model_dump に含まれず、等価性にも影響しない。"""
+        rule = ApplicabilityRule(content_patterns=(r"\bTODO\b",))
+        _ = rule.compiled_content_patterns
+        assert "compiled_content_patterns" not in rule.model_dump()
+        assert rule == ApplicabilityRule(content_patterns=(r"\bTODO\b",))
+
 
 # =============================================================================
 # ApplicabilityRule — 制約
@@ -162,6 +199,20 @@ class TestApplicabilityRuleConstraints:
         with pytest.raises(ValidationError, match="Invalid regex pattern"):
             ApplicabilityRule(content_patterns=(r"valid\d+", "(unclosed"))
 
+    def test_invalid_regex_rejected_on_repeat(self) -> None:
+        """無効な正規表現はキャッシュされず、再検証でも拒否される。"""
+        for _ in range(2):
+            with pytest.raises(ValidationError, match="Invalid regex pattern"):
+                ApplicabilityRule(content_patterns=("[invalid",))
+
+    def test_regex_compiled_once_per_pattern(self) -> None:
+        """同一パターンの再検証ではコンパイル結果が再利用される。"""
+        pattern = r"applicability-cache-\d+"
+        ApplicabilityRule(content_patterns=(pattern,))
+        hits = _compile_pattern.cache_info().hits
+        ApplicabilityRule(content_patterns=(pattern,))
+        assert _compile_pattern.cache_info().hits == hits + 1
+
     def test_frozen_assignment_rejected(self) -> None:
         """frozen=True によりフィールド変更が拒否される。"""
         rule = ApplicabilityRule()
@@ -229,17 +280,20 @@ class TestLoadErrorConstraints:
 # =============================================================================
 
 
-def _valid_agent_data(**overrides: object) -> dict[str, object]:
-    """AgentDefinition の最小限有効データを返す。"""
-    base: dict[str, object] = {
+_BASE_AGENT_DATA: Final[Mapping[str, object]] = MappingProxyType(
+    {
         "name": "test-agent",
         "description": "A test agent",
         "model": "claude-opus-4-6-20250929",
         "output_schema": "scored_issues",
         "system_prompt": "You are a test agent.",
     }
-    base.update(overrides)
-    return base
+)
+
+
+def _valid_agent_data(**overrides: object) -> dict[str, object]:
+    """AgentDefinition の最小限有効データを返す。"""
+    return {**_BASE_AGENT_DATA, **overrides}
 
 
 # =============================================================================
@@ -328,6 +382,21 @@ class TestAgentDefinitionValid:
         assert agent.applicability.always is False
         assert agent.applicability.file_patterns == ("*.py",)
 
+    def test_default_applicability_shared(self) -> None:
+        """applicability 未指定のエージェント間で同一インスタンスを共有する。"""
+        a1 = AgentDefinition.model_validate(_valid_agent_data())
+        a2 = AgentDefinition.model_validate(_valid_agent_data(name="other-agent"))
+        assert a1.applicability is a2.applicability
+
+    def test_identical_applicability_interned(self) -> None:
+        """同一内容の applicability は同一インスタンスに集約される。"""
+        rule = {"file_patterns": ["*.py"], "content_patterns": [r"import\s+os"]}
+        a1 = AgentDefinition.model_validate(_valid_agent_data(applicability=rule))
+        a2 = AgentDefinition.model_validate(
+            _valid_agent_data(name="other-agent", applicability=dict(rule))
+        )
+        assert a1.applicability is a2.applicability
+
     def test_isinstance_hachimoku_base_model(self) -> None:
         """HachimokuBaseModel のインスタンスである。"""
         agent = AgentDefinition.model_validate(_valid_agent_data())
@@ -509,6 +578,12 @@ class TestAgentDefinitionConstraints:
         """AGENT_NAME_PATTERN 定数がエクスポートされている。"""
         assert AGENT_NAME_PATTERN == r"^[a-z0-9-]+$"
 
+    def test_agent_name_re_compiled_from_pattern(self) -> None:
+        """AGENT_NAME_RE は AGENT_NAME_PATTERN をコンパイルしたものである。"""
+        assert AGENT_NAME_RE.pattern == AGENT_NAME_PATTERN
+        assert AGENT_NAME_RE.fullmatch("code-reviewer")
+        assert AGENT_NAME_RE.fullmatch("Code_Reviewer") is None
+
 
 # =============================================================================
 # LoadResult — 正常系
@@ -550,6 +625,16 @@ class TestLoadResultValid:
         assert len(result.agents) == 2
         assert len(result.errors) == 2
 
+    def test_instances_not_revalidated(self) -> None:
+        """渡した AgentDefinition / LoadError は再検証・コピーされずそのまま保持される。"""
+        agent1 = AgentDefinition.model_validate(_valid_agent_data(name="agent-1"))
+        agent2 = AgentDefinition.model_validate(_valid_agent_data(name="agent-2"))
+        err = LoadError(source="a.toml", message="err")
+        result = LoadResult(agents=(agent1, agent2), errors=(err,))
+        assert result.agents[0] is agent1
+        assert result.agents[1] is agent2
+        assert result.errors[0] is err
+
     def test_isinstance_hachimoku_base_model(self) -> None:
         """HachimokuBaseModel のインスタンスである。"""
         result = LoadResult(agents=())
@@ -581,16 +666,32 @@ class TestLoadResultConstraints:
 # =============================================================================
 
 
-def _valid_selector_data(**overrides: object) -> dict[str, object]:
-    """SelectorDefinition の最小限有効データを返す。"""
-    base: dict[str, object] = {
+_BASE_SELECTOR_DATA: Final[Mapping[str, object]] = MappingProxyType(
+    {
         "name": "selector",
         "description": "Agent selector for code review",
         "model": "claudecode:claude-opus-4-7",
         "system_prompt": "You are an agent selector.",
     }
-    base.update(overrides)
-    return base
+)
+
+
+def _valid_selector_data(**overrides: object) -> dict[str, object]:
+    """SelectorDefinition の最小限有効データを返す。
+
+    不変テンプレート _BASE_SELECTOR_DATA をコピーして上書きするため、
+    呼び出し側で返り値を変更しても他のテストには影響しない。
+    """
+    return {**_BASE_SELECTOR_DATA, **overrides}
+
+
+@pytest.fixture(scope="session")
+def valid_selector() -> SelectorDefinition:
+    """最小限有効データから生成した SelectorDefinition（セッション内で共有）。
+
+    SelectorDefinition は frozen のため、テスト間で共有しても安全。
+    """
+    return SelectorDefinition.model_validate(_valid_selector_data())
 
 
 # =============================================================================
@@ -639,93 +740,72 @@ class TestSelectorDefinitionValid:
 # =============================================================================
 
 
-class TestSelectorDefinitionConstraints:
-    """SelectorDefinition の制約を検証。"""
+def _selector_data_without(key: str) -> dict[str, object]:
+    """指定キーを除いた SelectorDefinition データを返す。"""
+    data = _valid_selector_data()
+    del data[key]
+    return data
+
+
+_INVALID_SELECTOR_CASES = [
+    pytest.param(_valid_selector_data(name="Selector"), "name", id="name-uppercase"),
+    pytest.param(_valid_selector_data(name=""), "name", id="name-empty"),
+    pytest.param(_selector_data_without("name"), "name", id="missing-name"),
+    pytest.param(
+        _selector_data_without("description"), "description", id="missing-description"
+    ),
+    pytest.param(
+        _selector_data_without("system_prompt"),
+        "system_prompt",
+        id="missing-system-prompt",
+    ),
+    pytest.param(
+        _valid_selector_data(unknown="x"), "extra_forbidden", id="extra-field"
+    ),
+    # ToolCategory に存在しないツール名
+    pytest.param(
+        _valid_selector_data(allowed_tools=["invalid_tool"]),
+        "allowed_tools",
+        id="invalid-allowed-tools",
+    ),
+    # 個別ツール名は正しいカテゴリ名を案内する
+    pytest.param(
+        _valid_selector_data(allowed_tools=["list_directory"]),
+        r"'list_directory' is not a tool category\. Did you mean 'file_read'\?",
+        id="individual-tool-name-suggests-category",
+    ),
+]
 
-    def test_invalid_name_uppercase(self) -> None:
-        """大文字を含む name がバリデーションエラーとなる。"""
-        with pytest.raises(ValidationError, match="name"):
-            SelectorDefinition.model_validate(_valid_selector_data(name="Selector"))
 
-    def test_invalid_name_empty(self) -> None:
-        """空文字列の name がバリデーションエラーとなる。"""
-        with pytest.raises(ValidationError, match="name"):
-            SelectorDefinition.model_validate(_valid_selector_data(name=""))
+class TestSelectorDefinitionConstraints:
+    """SelectorDefinition の制約を検証。"""
 
-    def test_missing_required_field_name(self) -> None:
-        """name 欠損で ValidationError。"""
-        data = _valid_selector_data()
-        del data["name"]
-        with pytest.raises(ValidationError, match="name"):
+    @pytest.mark.parametrize(("data", "match"), _INVALID_SELECTOR_CASES)
+    def test_invalid_data_rejected(self, data: dict[str, object], match: str) -> None:
+        """制約違反のデータがバリデーションエラーとなる。"""
+        with pytest.raises(ValidationError, match=match):
             SelectorDefinition.model_validate(data)
 
-    def test_missing_required_field_description(self) -> None:
-        """description 欠損で ValidationError。"""
-        data = _valid_selector_data()
-        del data["description"]
-        with pytest.raises(ValidationError, match="description"):
-            SelectorDefinition.model_validate(data)
+    @pytest.mark.parametrize("field", ["output_schema", "applicability", "phase"])
+    def test_agent_only_field_not_in_schema(self, field: str) -> None:
+        """AgentDefinition 固有のフィールドは SelectorDefinition のスキーマに含まれない。
+
+        extra=forbid による拒否自体は extra-field ケースで検証する。
+        """
+        assert field in AgentDefinition.model_fields
+        assert field not in SelectorDefinition.model_fields
 
     def test_model_defaults_to_none(self) -> None:
         """model 省略時は None になる。"""
-        data = _valid_selector_data()
-        del data["model"]
-        selector = SelectorDefinition.model_validate(data)
+        selector = SelectorDefinition.model_validate(_selector_data_without("model"))
         assert selector.model is None
 
-    def test_missing_required_field_system_prompt(self) -> None:
-        """system_prompt 欠損で ValidationError。"""
-        data = _valid_selector_data()
-        del data["system_prompt"]
-        with pytest.raises(ValidationError, match="system_prompt"):
-            SelectorDefinition.model_validate(data)
-
-    def test_frozen_assignment_rejected(self) -> None:
+    def test_frozen_assignment_rejected(
+        self, valid_selector: SelectorDefinition
+    ) -> None:
         """frozen=True によりフィールド変更が拒否される。"""
-        selector = SelectorDefinition.model_validate(_valid_selector_data())
         with pytest.raises(ValidationError, match="frozen"):
-            selector.name = "changed"  # type: ignore[misc]
-
-    def test_extra_field_rejected(self) -> None:
-        """定義外フィールドがバリデーションエラーとなる。"""
-        with pytest.raises(ValidationError, match="extra_forbidden"):
-            SelectorDefinition.model_validate(_valid_selector_data(unknown="x"))
-
-    def test_output_schema_field_rejected(self) -> None:
-        """AgentDefinition 固有の output_schema が extra=forbid で拒否される。"""
-        with pytest.raises(ValidationError, match="extra_forbidden"):
-            SelectorDefinition.model_validate(
-                _valid_selector_data(output_schema="scored_issues")
-            )
-
-    def test_applicability_field_rejected(self) -> None:
-        """AgentDefinition 固有の applicability が extra=forbid で拒否される。"""
-        with pytest.raises(ValidationError, match="extra_forbidden"):
-            SelectorDefinition.model_validate(
-                _valid_selector_data(applicability={"always": True})
-            )
-
-    def test_phase_field_rejected(self) -> None:
-        """AgentDefinition 固有の phase が extra=forbid で拒否される。"""
-        with pytest.raises(ValidationError, match="extra_forbidden"):
-            SelectorDefinition.model_validate(_valid_selector_data(phase="main"))
-
-    def test_invalid_allowed_tools_rejected(self) -> None:
-        """ToolCategory に存在しないツール名がバリデーションエラーとなる。"""
-        with pytest.raises(ValidationError, match="allowed_tools"):
-            SelectorDefinition.model_validate(
-                _valid_selector_data(allowed_tools=["invalid_tool"])
-            )
-
-    def test_individual_tool_name_suggests_category(self) -> None:
-        """個別ツール名を指定した場合、正しいカテゴリ名を案内するエラーメッセージが表示される。"""
-        with pytest.raises(
-            ValidationError,
-            match=r"'list_directory' is not a tool category\. Did you mean 'file_read'\?",
-        ):
-            SelectorDefinition.model_validate(
-                _valid_selector_data(allowed_tools=["list_directory"])
-            )
+            valid_selector.name = "changed"  # type: ignore[misc]
 
 
 # =============================================================================
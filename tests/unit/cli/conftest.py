@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from hachimoku.agents import AgentDefinition, LoadError, LoadResult
+from hachimoku.cli._file_resolver import ResolvedFiles
 from hachimoku.engine._engine import EngineResult
 from hachimoku.models.config import HachimokuConfig
 from hachimoku.models.exit_code import ExitCode
@@ -22,10 +24,17 @@ PATCH_LOAD_BUILTIN_AGENTS = "hachimoku.cli._app.load_builtin_agents"
 PATCH_FIND_PROJECT_ROOT = "hachimoku.cli._app.find_project_root"
 PATCH_SAVE_REVIEW_HISTORY = "hachimoku.cli._history_writer.save_review_history"
 
+_DEFAULT_CONFIG = HachimokuConfig()
+"""setup_mocks が返すデフォルト設定。HachimokuConfig は frozen のため共有して安全。"""
 
-@pytest.fixture(autouse=True)
+
+@pytest.fixture(autouse=True, scope="package")
 def _prevent_review_history_writes() -> Iterator[None]:
-    """テストが実ファイルシステムにレビュー履歴を書き込むことを防止する。"""
+    """テストが実ファイルシステムにレビュー履歴を書き込むことを防止する。
+
+    パッチ対象は常に同じ戻り値を返すシンクのため、CLI テストパッケージ全体で
+    1回だけ適用する。個別テストでは @patch(PATCH_SAVE_REVIEW_HISTORY) で上書き可能。
+    """
     with patch(PATCH_SAVE_REVIEW_HISTORY, return_value=Path("/dev/null")):
         yield
 
@@ -42,8 +51,30 @@ def _mock_project_root() -> Iterator[None]:
         yield
 
 
+@pytest.fixture(scope="session")
+def default_config() -> HachimokuConfig:
+    """デフォルト値の HachimokuConfig（セッション内で共有）。"""
+    return _DEFAULT_CONFIG
+
+
+@pytest.fixture(scope="session")
+def resolved_auth_py() -> ResolvedFiles:
+    """file モードテスト用の解決済みファイル（/abs/src/auth.py のみ）。"""
+    return ResolvedFiles(paths=("/abs/src/auth.py",))
+
+
 def make_engine_result(exit_code: ExitCode = ExitCode.SUCCESS) -> EngineResult:
-    """テスト用の最小 EngineResult を生成する。"""
+    """テスト用の最小 EngineResult を返す。
+
+    EngineResult は frozen かつ CLI からは読み取り専用のため、
+    終了コードごとに生成済みインスタンスを共有する。
+    """
+    return _engine_result_for(exit_code)
+
+
+@lru_cache(maxsize=len(ExitCode))
+def _engine_result_for(exit_code: ExitCode) -> EngineResult:
+    """終了コードに対応する最小 EngineResult を生成する。"""
     return EngineResult(
         report=ReviewReport(
             results=[],
@@ -63,10 +94,29 @@ def setup_mocks(
     exit_code: ExitCode = ExitCode.SUCCESS,
 ) -> None:
     """共通のモックセットアップ。"""
-    mock_config.return_value = HachimokuConfig()
+    mock_config.return_value = _DEFAULT_CONFIG
     mock_run_review.return_value = make_engine_result(exit_code)
 
 
+def install_review_mocks(
+    monkeypatch: pytest.MonkeyPatch,
+    exit_code: ExitCode = ExitCode.SUCCESS,
+) -> tuple[MagicMock, AsyncMock]:
+    """resolve_config / run_review をモックに差し替え、両モックを返す。
+
+    monkeypatch による単純な属性差し替えのため、テスト終了時に自動で復元される。
+
+    Returns:
+        (mock_config, mock_run_review) のタプル。
+    """
+    mock_config = MagicMock()
+    mock_run_review = AsyncMock()
+    setup_mocks(mock_config, mock_run_review, exit_code)
+    monkeypatch.setattr(PATCH_RESOLVE_CONFIG, mock_config)
+    monkeypatch.setattr(PATCH_RUN_REVIEW, mock_run_review)
+    return mock_config, mock_run_review
+
+
 def make_agent_definition(
     name: str = "test-agent",
     model: str = "test-model",
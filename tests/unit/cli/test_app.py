@@ -1,7 +1,7 @@
 """Typer app のテスト。
 
 FR-CLI-001: デュアルコマンド名。
-FR-CLI-002: 位置引数からの入力モード判定（review_callback 経由）。
+FR-CLI-002: 位置引数からの入力モード判定（review_callback 経由、TestReviewExecution）。
 FR-CLI-003: 終了コードの検証。
 FR-CLI-004: stdout/stderr ストリーム分離。
 FR-CLI-006: CLI オプション対応表。
@@ -24,7 +24,7 @@ import click
 import pytest
 
 from pydantic import ValidationError
-from typer.testing import CliRunner
+from typer.testing import CliRunner, Result
 
 from hachimoku.cli._app import app
 from hachimoku.cli._file_resolver import FileResolutionError, ResolvedFiles
@@ -43,6 +43,7 @@ from tests.unit.cli.conftest import (
     PATCH_SAVE_REVIEW_HISTORY,
     make_agent_definition,
     make_engine_result,
+    install_review_mocks,
     make_load_result,
     setup_mocks,
 )
@@ -55,127 +56,45 @@ PATCH_PROMPT_MISSING_PROJECT = "hachimoku.cli._app._prompt_missing_project"
 runner = CliRunner()
 
 
-# --- US1 テスト（既存、run_review モック付きに更新） ---
-
-
-class TestAppHelp:
-    """--help の動作を検証する。"""
+@pytest.fixture(scope="module")
+def help_result() -> Result:
+    """`--help` の実行結果。出力は不変のためモジュール内で共有する。"""
+    return runner.invoke(app, ["--help"])
 
-    def test_help_exits_with_zero(self) -> None:
-        result = runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-
-    def test_help_contains_tool_description(self) -> None:
-        result = runner.invoke(app, ["--help"])
-        assert "Multi-agent code review" in result.output
 
-    def test_help_shows_subcommands(self) -> None:
-        """--help にサブコマンド情報が含まれる。"""
-        result = runner.invoke(app, ["--help"])
-        assert "config" in result.output
-
-    def test_help_shows_review_modes(self) -> None:
-        """--help にレビューモード（diff/PR/file）の説明が含まれる。"""
-        result = runner.invoke(app, ["--help"])
-        assert "diff mode" in result.output
-        assert "PR mode" in result.output
-        assert "file mode" in result.output
+@pytest.fixture(scope="module")
+def init_help_result() -> Result:
+    """`init --help` の実行結果。出力は不変のためモジュール内で共有する。"""
+    return runner.invoke(app, ["init", "--help"])
 
 
-class TestReviewCallbackDiffMode:
-    """引数なしで diff モード判定を検証する。"""
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_no_args_exits_with_zero(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """引数なし → diff モード → 正常終了。"""
-        setup_mocks(mock_config, mock_run_review)
-        result = runner.invoke(app)
-        assert result.exit_code == 0
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_no_args_calls_run_review_with_diff_target(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """引数なし → DiffTarget で run_review が呼ばれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app)
-        mock_run_review.assert_called_once()
-        target = mock_run_review.call_args.kwargs["target"]
-        assert isinstance(target, DiffTarget)
+@pytest.fixture(scope="module")
+def config_result() -> Result:
+    """予約サブコマンド `config` の実行結果。出力は不変のためモジュール内で共有する。"""
+    return runner.invoke(app, ["config"])
 
 
-class TestReviewCallbackPRMode:
-    """整数引数で PR モード判定を検証する。"""
+# --- US1 テスト（既存、run_review モック付きに更新） ---
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_integer_arg_exits_with_zero(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """整数引数 → PR モード → 正常終了。"""
-        setup_mocks(mock_config, mock_run_review)
-        result = runner.invoke(app, ["123"])
-        assert result.exit_code == 0
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_integer_arg_calls_run_review_with_pr_target(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """整数引数 → PRTarget(pr_number=123) で run_review が呼ばれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, ["123"])
-        mock_run_review.assert_called_once()
-        target = mock_run_review.call_args.kwargs["target"]
-        assert isinstance(target, PRTarget)
-        assert target.pr_number == 123
+class TestAppHelp:
+    """--help の動作を検証する。"""
 
+    def test_help_exits_with_zero(self, help_result: Result) -> None:
+        assert help_result.exit_code == 0
 
-class TestReviewCallbackFileMode:
-    """パスライク引数で file モード判定を検証する。"""
+    def test_help_contains_tool_description(self, help_result: Result) -> None:
+        assert "Multi-agent code review" in help_result.output
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_FILES)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_path_like_arg_exits_with_zero(
-        self,
-        mock_config: MagicMock,
-        mock_resolve_files: MagicMock,
-        mock_run_review: AsyncMock,
-    ) -> None:
-        """パスライク引数 → file モード → 正常終了。"""
-        setup_mocks(mock_config, mock_run_review)
-        mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
-            (),
-        )
-        result = runner.invoke(app, ["src/auth.py"])
-        assert result.exit_code == 0
+    def test_help_shows_subcommands(self, help_result: Result) -> None:
+        """--help にサブコマンド情報が含まれる。"""
+        assert "config" in help_result.output
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_FILES)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_path_like_arg_calls_run_review_with_file_target(
-        self,
-        mock_config: MagicMock,
-        mock_resolve_files: MagicMock,
-        mock_run_review: AsyncMock,
-    ) -> None:
-        """パスライク引数 → FileTarget で run_review が呼ばれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
-            (),
-        )
-        runner.invoke(app, ["src/auth.py"])
-        mock_run_review.assert_called_once()
-        target = mock_run_review.call_args.kwargs["target"]
-        assert isinstance(target, FileTarget)
-        assert "/abs/src/auth.py" in target.paths
+    def test_help_shows_review_modes(self, help_result: Result) -> None:
+        """--help にレビューモード（diff/PR/file）の説明が含まれる。"""
+        assert "diff mode" in help_result.output
+        assert "PR mode" in help_result.output
+        assert "file mode" in help_result.output
 
 
 class TestReviewCallbackError:
@@ -200,27 +119,30 @@ class TestReviewCallbackError:
 class TestConfigSubcommand:
     """config 予約サブコマンドを検証する（R-009）。"""
 
-    def test_config_exits_with_four(self) -> None:
+    def test_config_exits_with_four(self, config_result: Result) -> None:
         """config コマンドは未実装エラー（終了コード 4）。"""
-        result = runner.invoke(app, ["config"])
-        assert result.exit_code == 4
+        assert config_result.exit_code == 4
 
-    def test_config_output_contains_not_implemented(self) -> None:
+    def test_config_output_contains_not_implemented(
+        self, config_result: Result
+    ) -> None:
         """出力に未実装メッセージが含まれる。"""
-        result = runner.invoke(app, ["config"])
-        assert "not implemented" in result.output.lower()
+        assert "not implemented" in config_result.output.lower()
 
-    def test_config_output_contains_edit_hint(self) -> None:
+    def test_config_output_contains_edit_hint(self, config_result: Result) -> None:
         """出力に設定ファイル直接編集のヒントが含まれる。"""
-        result = runner.invoke(app, ["config"])
-        assert "config.toml" in result.output
+        assert "config.toml" in config_result.output
 
 
 # --- US2 テスト（新規） ---
 
 
 class TestReviewExecution:
-    """レビュー実行フロー（run_review モック）の検証。"""
+    """レビュー実行フロー（run_review モック）の検証。
+
+    FR-CLI-002: 位置引数から判定された入力モード（diff/PR/file）ごとの
+    ターゲットで run_review が呼ばれることもここで検証する。
+    """
 
     @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
     @patch(PATCH_RESOLVE_CONFIG)
@@ -257,11 +179,12 @@ class TestReviewExecution:
         mock_config: MagicMock,
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """パスライク引数 → FileTarget で run_review が呼ばれる。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         result = runner.invoke(app, ["src/auth.py"])
@@ -286,171 +209,106 @@ class TestReviewExecution:
 class TestReviewExitCodes:
     """レビュー実行の終了コード検証（FR-CLI-003）。"""
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_exit_code_0_on_success(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """ExitCode.SUCCESS(0) → exit_code 0。"""
-        setup_mocks(mock_config, mock_run_review, ExitCode.SUCCESS)
-        result = runner.invoke(app)
-        assert result.exit_code == 0
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_exit_code_1_on_critical(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """ExitCode.CRITICAL(1) → exit_code 1。"""
-        setup_mocks(mock_config, mock_run_review, ExitCode.CRITICAL)
-        result = runner.invoke(app)
-        assert result.exit_code == 1
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_exit_code_2_on_important(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """ExitCode.IMPORTANT(2) → exit_code 2。"""
-        setup_mocks(mock_config, mock_run_review, ExitCode.IMPORTANT)
-        result = runner.invoke(app)
-        assert result.exit_code == 2
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_exit_code_3_on_execution_error(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+    @pytest.mark.parametrize(
+        "exit_code",
+        [
+            ExitCode.SUCCESS,
+            ExitCode.CRITICAL,
+            ExitCode.IMPORTANT,
+            ExitCode.EXECUTION_ERROR,
+        ],
+        ids=lambda code: code.name.lower(),
+    )
+    def test_exit_code_matches_engine_result(
+        self, monkeypatch: pytest.MonkeyPatch, exit_code: ExitCode
     ) -> None:
-        """ExitCode.EXECUTION_ERROR(3) → exit_code 3。"""
-        setup_mocks(mock_config, mock_run_review, ExitCode.EXECUTION_ERROR)
+        """EngineResult.exit_code がそのままプロセスの終了コードになる。"""
+        install_review_mocks(monkeypatch, exit_code)
         result = runner.invoke(app)
-        assert result.exit_code == 3
+        assert result.exit_code == exit_code
 
 
 class TestReviewConfigOverrides:
     """CLI オプションから config_overrides 辞書の構築を検証する（FR-CLI-006）。"""
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_model_option(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """--model → config_overrides に "model" キーが含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, ["--model", "gpt-4o"])
-        overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert overrides["model"] == "gpt-4o"
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_timeout_option(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """--timeout → config_overrides に "timeout" キーが含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, ["--timeout", "600"])
-        overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert overrides["timeout"] == 600
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_max_turns_option(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+    @pytest.mark.parametrize(
+        ("cli_args", "config_key", "expected"),
+        [
+            pytest.param(["--model", "gpt-4o"], "model", "gpt-4o", id="model"),
+            pytest.param(["--timeout", "600"], "timeout", 600, id="timeout"),
+            pytest.param(["--max-turns", "5"], "max_turns", 5, id="max-turns"),
+            pytest.param(
+                ["--base-branch", "develop"],
+                "base_branch",
+                "develop",
+                id="base-branch",
+            ),
+        ],
+    )
+    def test_option_sets_override(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        cli_args: list[str],
+        config_key: str,
+        expected: object,
     ) -> None:
-        """--max-turns → config_overrides に "max_turns" キーが含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, ["--max-turns", "5"])
+        """--model/--timeout/--max-turns/--base-branch → 同名キーで config_overrides に含まれる。"""
+        _, mock_run_review = install_review_mocks(monkeypatch)
+        runner.invoke(app, cli_args)
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert overrides["max_turns"] == 5
+        assert overrides[config_key] == expected
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_format_option_key_mapping(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_format_option_key_mapping(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """--format → config_overrides に "output_format" キーが含まれる（キー名変換）。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--format", "json"])
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert "output_format" in overrides
         assert "format" not in overrides
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
     def test_max_files_option_key_mapping(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """--max-files → config_overrides に "max_files_per_review" キーが含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--max-files", "50"])
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert "max_files_per_review" in overrides
         assert "max_files" not in overrides
         assert overrides["max_files_per_review"] == 50
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_ext_option_key_mapping(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_ext_option_key_mapping(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """--ext → config_overrides に "file_extensions" キーが含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--ext", ".py"])
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert "file_extensions" in overrides
         assert "ext" not in overrides
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_ext_option_single_value(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_ext_option_single_value(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """--ext .py → config_overrides["file_extensions"] == (".py",)。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--ext", ".py"])
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert overrides["file_extensions"] == (".py",)
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_ext_option_multiple_values(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_ext_option_multiple_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """--ext .py --ext .rst → config_overrides["file_extensions"] == (".py", ".rst")。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--ext", ".py", "--ext", ".rst"])
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert overrides["file_extensions"] == (".py", ".rst")
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_ext_option_not_specified(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_ext_option_not_specified(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """--ext 未指定 → config_overrides に "file_extensions" キーが含まれない。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app)
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert "file_extensions" not in overrides
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_base_branch_option(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """--base-branch → config_overrides に "base_branch" キーが含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, ["--base-branch", "develop"])
-        overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert overrides["base_branch"] == "develop"
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_no_options_empty_overrides(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_no_options_empty_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """オプション未指定 → config_overrides に設定キーが含まれない（None 除外）。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app)
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         config_keys = {
@@ -467,26 +325,20 @@ class TestReviewConfigOverrides:
         }
         assert not (set(overrides.keys()) & config_keys)
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_multiple_options_combined(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
+    def test_multiple_options_combined(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """複数オプション同時指定 → 全てが config_overrides に含まれる。"""
-        setup_mocks(mock_config, mock_run_review)
+        _, mock_run_review = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--model", "opus", "--timeout", "600", "--format", "json"])
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
         assert overrides["model"] == "opus"
         assert overrides["timeout"] == 600
         assert overrides["output_format"] == "json"
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
     def test_resolve_config_receives_overrides(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """resolve_config が config_overrides を受け取る（I-4）。"""
-        setup_mocks(mock_config, mock_run_review)
+        mock_config, _ = install_review_mocks(monkeypatch)
         runner.invoke(app, ["--model", "opus"])
         mock_config.assert_called_once()
         call_kwargs = mock_config.call_args.kwargs
@@ -494,10 +346,12 @@ class TestReviewConfigOverrides:
         assert call_kwargs["cli_overrides"]["model"] == "opus"
 
 
-_BOOLEAN_FLAG_CASES: list[tuple[str, str, str]] = [
-    ("--parallel", "--no-parallel", "parallel"),
-    ("--save-reviews", "--no-save-reviews", "save_reviews"),
-    ("--show-cost", "--no-show-cost", "show_cost"),
+_BOOLEAN_FLAG_CASES = [
+    pytest.param("--parallel", "--no-parallel", "parallel", id="parallel"),
+    pytest.param(
+        "--save-reviews", "--no-save-reviews", "save_reviews", id="save-reviews"
+    ),
+    pytest.param("--show-cost", "--no-show-cost", "show_cost", id="show-cost"),
 ]
 
 
@@ -505,121 +359,58 @@ class TestReviewBooleanFlags:
     """boolean フラグペア（--parallel/--no-parallel 等）の三値テスト（R-005）。"""
 
     @pytest.mark.parametrize(
-        ("cli_flag", "config_key"),
-        [(flag_true, key) for flag_true, _, key in _BOOLEAN_FLAG_CASES],
+        ("flag_true", "flag_false", "config_key"), _BOOLEAN_FLAG_CASES
     )
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_flag_true(
+    @pytest.mark.parametrize("mode", ["true", "false", "unset"])
+    def test_boolean_flag(
         self,
-        mock_config: MagicMock,
-        mock_run_review: AsyncMock,
-        cli_flag: str,
+        monkeypatch: pytest.MonkeyPatch,
+        mode: str,
+        flag_true: str,
+        flag_false: str,
         config_key: str,
     ) -> None:
-        """--flag → config_overrides[key] == True。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, [cli_flag])
+        """--flag → True、--no-flag → False、未指定 → config_overrides に key なし。"""
+        cli_args = {"true": [flag_true], "false": [flag_false], "unset": []}[mode]
+        _, mock_run_review = install_review_mocks(monkeypatch)
+        runner.invoke(app, cli_args)
         overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert overrides[config_key] is True
-
-    @pytest.mark.parametrize(
-        ("cli_flag", "config_key"),
-        [(flag_false, key) for _, flag_false, key in _BOOLEAN_FLAG_CASES],
-    )
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_flag_false(
-        self,
-        mock_config: MagicMock,
-        mock_run_review: AsyncMock,
-        cli_flag: str,
-        config_key: str,
-    ) -> None:
-        """--no-flag → config_overrides[key] == False。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, [cli_flag])
-        overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert overrides[config_key] is False
-
-    @pytest.mark.parametrize(
-        "config_key",
-        [key for _, _, key in _BOOLEAN_FLAG_CASES],
-    )
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_flag_unset(
-        self,
-        mock_config: MagicMock,
-        mock_run_review: AsyncMock,
-        config_key: str,
-    ) -> None:
-        """未指定 → config_overrides に key なし。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app)
-        overrides = mock_run_review.call_args.kwargs["config_overrides"]
-        assert config_key not in overrides
+        if mode == "unset":
+            assert config_key not in overrides
+        else:
+            assert overrides[config_key] is (mode == "true")
 
 
 class TestReviewIssueOption:
     """--issue per-invocation オプションの検証。"""
 
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_issue_passed_to_diff_target(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """diff モード + --issue → DiffTarget.issue_number に設定される。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app, ["--issue", "50"])
-        target = mock_run_review.call_args.kwargs["target"]
-        assert isinstance(target, DiffTarget)
-        assert target.issue_number == 50
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_issue_passed_to_pr_target(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """PR モード + --issue → PRTarget.issue_number に設定される。"""
-        setup_mocks(mock_config, mock_run_review)
-        # NOTE: --issue は位置引数の前後どちらでも動作する（#302 修正済み）。
-        runner.invoke(app, ["--issue", "50", "123"])
-        target = mock_run_review.call_args.kwargs["target"]
-        assert isinstance(target, PRTarget)
-        assert target.issue_number == 50
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_FILES)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_issue_passed_to_file_target(
+    # NOTE: --issue は位置引数の前後どちらでも動作する（#302 修正済み）。
+    @pytest.mark.parametrize(
+        ("cli_args", "expected_type", "expected_issue"),
+        [
+            pytest.param(["--issue", "50"], DiffTarget, 50, id="diff"),
+            pytest.param(["--issue", "50", "123"], PRTarget, 50, id="pr"),
+            pytest.param(["--issue", "50", "src/auth.py"], FileTarget, 50, id="file"),
+            pytest.param([], DiffTarget, None, id="unset-defaults-to-none"),
+        ],
+    )
+    def test_issue_passed_to_target(
         self,
-        mock_config: MagicMock,
-        mock_resolve_files: MagicMock,
-        mock_run_review: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+        resolved_auth_py: ResolvedFiles,
+        cli_args: list[str],
+        expected_type: type[DiffTarget | PRTarget | FileTarget],
+        expected_issue: int | None,
     ) -> None:
-        """file モード + --issue → FileTarget.issue_number に設定される。"""
-        setup_mocks(mock_config, mock_run_review)
-        mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
-            (),
+        """各モード + --issue → target.issue_number に設定される（未指定なら None）。"""
+        _, mock_run_review = install_review_mocks(monkeypatch)
+        monkeypatch.setattr(
+            PATCH_RESOLVE_FILES, MagicMock(return_value=(resolved_auth_py, ()))
         )
-        # NOTE: --issue は位置引数の前後どちらでも動作する（#302 修正済み）。
-        runner.invoke(app, ["--issue", "50", "src/auth.py"])
-        target = mock_run_review.call_args.kwargs["target"]
-        assert isinstance(target, FileTarget)
-        assert target.issue_number == 50
-
-    @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
-    @patch(PATCH_RESOLVE_CONFIG)
-    def test_no_issue_default_none(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
-    ) -> None:
-        """--issue 未指定 → target.issue_number == None。"""
-        setup_mocks(mock_config, mock_run_review)
-        runner.invoke(app)
+        runner.invoke(app, cli_args)
         target = mock_run_review.call_args.kwargs["target"]
-        assert target.issue_number is None
+        assert isinstance(target, expected_type)
+        assert target.issue_number == expected_issue
 
 
 class TestReviewRunReviewError:
@@ -628,10 +419,13 @@ class TestReviewRunReviewError:
     @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_run_review_exception_exits_with_3(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self,
+        mock_config: MagicMock,
+        mock_run_review: AsyncMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """run_review が例外送出 → exit_code 3（EXECUTION_ERROR）。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_run_review.side_effect = RuntimeError("Engine failed")
         result = runner.invoke(app)
         assert result.exit_code == 3
@@ -639,10 +433,13 @@ class TestReviewRunReviewError:
     @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_run_review_exception_outputs_error_message(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self,
+        mock_config: MagicMock,
+        mock_run_review: AsyncMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """run_review 例外時にエラーメッセージが出力される。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_run_review.side_effect = RuntimeError("Engine failed")
         result = runner.invoke(app)
         assert "error" in result.output.lower()
@@ -651,10 +448,13 @@ class TestReviewRunReviewError:
     @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_run_review_exception_contains_hint(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self,
+        mock_config: MagicMock,
+        mock_run_review: AsyncMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """run_review 例外のエラーメッセージに解決方法ヒントが含まれる（FR-CLI-014）。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_run_review.side_effect = RuntimeError("Engine failed")
         result = runner.invoke(app)
         assert "--help" in result.output
@@ -672,10 +472,13 @@ class TestReviewGroupExceptionChain:
     @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_pr_mode_exception_has_no_usage_error_in_chain(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self,
+        mock_config: MagicMock,
+        mock_run_review: AsyncMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """PR モードでの例外チェーンに UsageError が含まれない。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_run_review.side_effect = RuntimeError("Engine failed")
         result = runner.invoke(app, ["123"])
         assert result.exit_code == 3
@@ -692,10 +495,13 @@ class TestReviewGroupExceptionChain:
     @patch(PATCH_RUN_REVIEW, new_callable=AsyncMock)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_diff_mode_exception_has_no_usage_error_in_chain(
-        self, mock_config: MagicMock, mock_run_review: AsyncMock
+        self,
+        mock_config: MagicMock,
+        mock_run_review: AsyncMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """diff モード（引数なし）の例外チェーンには元々 UsageError がない（回帰テスト）。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_run_review.side_effect = RuntimeError("Engine failed")
         result = runner.invoke(app)
         assert result.exit_code == 3
@@ -759,20 +565,17 @@ class TestReviewConfigError:
 class TestInitSubcommand:
     """init サブコマンドの CLI 統合テスト。FR-CLI-007."""
 
-    def test_init_help_exits_with_zero(self) -> None:
+    def test_init_help_exits_with_zero(self, init_help_result: Result) -> None:
         """init --help が正常終了する。"""
-        result = runner.invoke(app, ["init", "--help"])
-        assert result.exit_code == 0
+        assert init_help_result.exit_code == 0
 
-    def test_init_help_contains_description(self) -> None:
+    def test_init_help_contains_description(self, init_help_result: Result) -> None:
         """init --help に説明が含まれる。"""
-        result = runner.invoke(app, ["init", "--help"])
-        assert "Initialize" in result.output
+        assert "Initialize" in init_help_result.output
 
-    def test_help_shows_init_subcommand(self) -> None:
+    def test_help_shows_init_subcommand(self, help_result: Result) -> None:
         """--help に init サブコマンド情報が含まれる。"""
-        result = runner.invoke(app, ["--help"])
-        assert "init" in result.output
+        assert "init" in help_result.output
 
     @patch(PATCH_RUN_INIT)
     def test_init_calls_run_init(self, mock_run_init: MagicMock) -> None:
@@ -861,10 +664,9 @@ class TestInitSubcommand:
         _, kwargs = mock_run_init.call_args
         assert kwargs["upgrade"] is False
 
-    def test_init_help_shows_upgrade_option(self) -> None:
+    def test_init_help_shows_upgrade_option(self, init_help_result: Result) -> None:
         """init --help に --upgrade オプションが表示される。"""
-        result = runner.invoke(app, ["init", "--help"])
-        assert "--upgrade" in result.output
+        assert "--upgrade" in init_help_result.output
 
     @patch(PATCH_RUN_INIT)
     def test_init_upgrade_force_passes_flags(self, mock_run_init: MagicMock) -> None:
@@ -966,11 +768,12 @@ class TestReviewCallbackFileModeResolution:
         mock_config: MagicMock,
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """resolve_files の結果が FileTarget.paths に渡される。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         runner.invoke(app, ["src/auth.py"])
@@ -981,10 +784,13 @@ class TestReviewCallbackFileModeResolution:
     @patch(PATCH_RESOLVE_FILES)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_file_resolution_error_exits_with_4(
-        self, mock_config: MagicMock, mock_resolve_files: MagicMock
+        self,
+        mock_config: MagicMock,
+        mock_resolve_files: MagicMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """FileResolutionError → exit code 4。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_resolve_files.side_effect = FileResolutionError("Not found")
         result = runner.invoke(app, ["nonexistent.py"])
         assert result.exit_code == ExitCode.INPUT_ERROR
@@ -992,10 +798,13 @@ class TestReviewCallbackFileModeResolution:
     @patch(PATCH_RESOLVE_FILES)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_file_resolution_error_shows_message(
-        self, mock_config: MagicMock, mock_resolve_files: MagicMock
+        self,
+        mock_config: MagicMock,
+        mock_resolve_files: MagicMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """FileResolutionError のメッセージが出力される。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_resolve_files.side_effect = FileResolutionError(
             "File not found: 'x.py'. Check the file path."
         )
@@ -1005,10 +814,13 @@ class TestReviewCallbackFileModeResolution:
     @patch(PATCH_RESOLVE_FILES)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_empty_result_exits_with_0(
-        self, mock_config: MagicMock, mock_resolve_files: MagicMock
+        self,
+        mock_config: MagicMock,
+        mock_resolve_files: MagicMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """resolve_files が None → exit code 0。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_resolve_files.return_value = (None, ())
         result = runner.invoke(app, ["src/"])
         assert result.exit_code == ExitCode.SUCCESS
@@ -1016,10 +828,13 @@ class TestReviewCallbackFileModeResolution:
     @patch(PATCH_RESOLVE_FILES)
     @patch(PATCH_RESOLVE_CONFIG)
     def test_empty_result_shows_message(
-        self, mock_config: MagicMock, mock_resolve_files: MagicMock
+        self,
+        mock_config: MagicMock,
+        mock_resolve_files: MagicMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """empty result → "No files found" メッセージ。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         mock_resolve_files.return_value = (None, ())
         result = runner.invoke(app, ["src/"])
         assert "no files found" in result.output.lower()
@@ -1192,10 +1007,9 @@ class TestAgentsSubcommand:
         result = runner.invoke(app, ["agents", "--help"])
         assert result.exit_code == 0
 
-    def test_help_shows_agents_subcommand(self) -> None:
+    def test_help_shows_agents_subcommand(self, help_result: Result) -> None:
         """--help に agents サブコマンド情報が含まれる。"""
-        result = runner.invoke(app, ["--help"])
-        assert "agents" in result.output
+        assert "agents" in help_result.output
 
     @patch(PATCH_FIND_PROJECT_ROOT, return_value=None)
     @patch(PATCH_LOAD_BUILTIN_AGENTS)
@@ -1696,9 +1510,10 @@ class TestEdgeCases:
         mock_config: MagicMock,
         _mock_git: MagicMock,
         cli_args: list[str],
+        default_config: HachimokuConfig,
     ) -> None:
         """diff/PR モードで Git リポジトリ外 → 終了コード 4。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         result = runner.invoke(app, cli_args)
         assert result.exit_code == ExitCode.INPUT_ERROR
 
@@ -1710,9 +1525,10 @@ class TestEdgeCases:
         mock_config: MagicMock,
         _mock_git: MagicMock,
         cli_args: list[str],
+        default_config: HachimokuConfig,
     ) -> None:
         """diff/PR モード Git 外エラーに解決方法ヒントが含まれる。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         result = runner.invoke(app, cli_args)
         assert "git" in result.output.lower()
 
@@ -1728,11 +1544,12 @@ class TestEdgeCases:
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
         _mock_git: MagicMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """file モードは Git リポジトリ外でも正常終了する。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         result = runner.invoke(app, ["src/auth.py"])
@@ -2091,11 +1908,12 @@ class TestOptionsAfterPositionalArgs:
         mock_config: MagicMock,
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """src/auth.py --ext .md → file_extensions が overrides に含まれる。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         result = runner.invoke(app, ["src/auth.py", "--ext", ".md"])
@@ -2131,11 +1949,12 @@ class TestOptionsAfterPositionalArgs:
         mock_config: MagicMock,
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """src/auth.py --model opus → model が overrides に含まれる。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         result = runner.invoke(app, ["src/auth.py", "--model", "opus"])
@@ -2151,11 +1970,12 @@ class TestOptionsAfterPositionalArgs:
         mock_config: MagicMock,
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """src/auth.py --issue 50 → FileTarget.issue_number に設定される。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         result = runner.invoke(app, ["src/auth.py", "--issue", "50"])
@@ -2205,11 +2025,12 @@ class TestOptionsAfterPositionalArgs:
         mock_config: MagicMock,
         mock_resolve_files: MagicMock,
         mock_run_review: AsyncMock,
+        resolved_auth_py: ResolvedFiles,
     ) -> None:
         """src/auth.py --ext .md → resolve_files に --ext, .md が渡されない。"""
         setup_mocks(mock_config, mock_run_review)
         mock_resolve_files.return_value = (
-            ResolvedFiles(paths=("/abs/src/auth.py",)),
+            resolved_auth_py,
             (),
         )
         result = runner.invoke(app, ["src/auth.py", "--ext", ".md"])
@@ -2339,20 +2160,20 @@ class TestReviewCallbackCommitMode:
 
     @patch(PATCH_RESOLVE_CONFIG)
     def test_commit_with_positional_args_exits_with_error(
-        self, mock_config: MagicMock
+        self, mock_config: MagicMock, default_config: HachimokuConfig
     ) -> None:
         """--commit + 位置引数 → exit code 4 (INPUT_ERROR)。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         result = runner.invoke(app, ["--commit", "abc123", "src/file.py"])
         assert result.exit_code == ExitCode.INPUT_ERROR
         assert "--commit cannot be used with positional arguments" in result.output
 
     @patch(PATCH_RESOLVE_CONFIG)
     def test_commit_with_base_branch_exits_with_error(
-        self, mock_config: MagicMock
+        self, mock_config: MagicMock, default_config: HachimokuConfig
     ) -> None:
         """--commit + --base-branch → exit code 4 (INPUT_ERROR)。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         result = runner.invoke(app, ["--commit", "abc123", "--base-branch", "develop"])
         assert result.exit_code == ExitCode.INPUT_ERROR
         assert "--commit cannot be used with --base-branch" in result.output
@@ -2370,18 +2191,20 @@ class TestReviewCallbackCommitMode:
         assert isinstance(target, CommitTarget)
         assert target.issue_number == 42
 
-    def test_commit_help_shown(self) -> None:
+    def test_commit_help_shown(self, help_result: Result) -> None:
         """--help に --commit オプションが表示される。"""
-        result = runner.invoke(app, ["--help"])
-        assert "--commit" in result.output
+        assert "--commit" in help_result.output
 
     @patch(PATCH_RESOLVE_CONFIG)
     @patch("hachimoku.cli._app._is_git_repository", return_value=False)
     def test_commit_mode_requires_git_repo(
-        self, mock_is_git: MagicMock, mock_config: MagicMock
+        self,
+        mock_is_git: MagicMock,
+        mock_config: MagicMock,
+        default_config: HachimokuConfig,
     ) -> None:
         """Git リポジトリ外で --commit → exit code 4。"""
-        mock_config.return_value = HachimokuConfig()
+        mock_config.return_value = default_config
         result = runner.invoke(app, ["--commit", "abc123"])
         assert result.exit_code == ExitCode.INPUT_ERROR
         assert "commit mode requires a Git repository" in result.output
@@ -3,11 +3,15 @@
 Issue #171: エージェント別 file_patterns ベースの差分フィルタリング。
 """
 
+import fnmatch
 import logging
 
 import pytest
 
-from hachimoku.engine._diff_filter import filter_diff_by_file_patterns
+from hachimoku.engine._diff_filter import (
+    _compile_file_patterns,
+    filter_diff_by_file_patterns,
+)
 
 # =============================================================================
 # テスト用 diff フィクスチャ
@@ -349,6 +353,40 @@ class TestFilterDiffIntegrity:
         assert "+import sys" in result
 
 
+# =============================================================================
+# _compile_file_patterns — fnmatch 互換の結合パターン
+# =============================================================================
+
+
+class TestCompileFilePatterns:
+    """_compile_file_patterns が fnmatch.fnmatch と同じ判定を行うことを検証。"""
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            ("*.py",),
+            ("*.py", "*.ts"),
+            ("test_*",),
+            ("Makefile", "*.[ch]"),
+            ("[!a]*.md",),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "name",
+        ["a.py", "b.ts", "test_x.py", "Makefile", "foo.c", "a.md", "x.md", "a.pyc"],
+    )
+    def test_matches_like_fnmatch(self, patterns: tuple[str, ...], name: str) -> None:
+        """結合パターンの判定が各パターンの fnmatch.fnmatch の OR と一致する。"""
+        expected = any(fnmatch.fnmatch(name, p) for p in patterns)
+        assert bool(_compile_file_patterns(patterns).match(name)) is expected
+
+    def test_compiled_once_per_pattern_tuple(self) -> None:
+        """同じ file_patterns では同一のコンパイル済みパターンが再利用される。"""
+        assert _compile_file_patterns(("*.py", "*.ts")) is _compile_file_patterns(
+            ("*.py", "*.ts")
+        )
+
+
 # =============================================================================
 # filter_diff_by_file_patterns — ログ出力
 # =============================================================================
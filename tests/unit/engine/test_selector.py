@@ -9,6 +9,7 @@ FR-RE-010: 空リスト返却時の正常終了。
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -41,11 +42,15 @@ _PASSTHROUGH_RESOLVE = lambda m, **_kw: m  # noqa: E731
 """resolve_model のパススルーモック。keyword 引数（allowed_builtin_tools 等）を無視する。"""
 
 
+@lru_cache(maxsize=256)
 def _make_agent(
     name: str = "test-agent",
     phase: Phase = Phase.MAIN,
 ) -> AgentDefinition:
-    """テスト用 AgentDefinition を生成するヘルパー。"""
+    """テスト用 AgentDefinition を生成するヘルパー。
+
+    AgentDefinition は frozen のため、同一引数の呼び出しでは生成済みインスタンスを共有する。
+    """
     return AgentDefinition(  # type: ignore[call-arg]
         name=name,
         description="Test agent for selection",
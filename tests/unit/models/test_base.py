@@ -4,6 +4,8 @@ FR-DM-009: 全モデルは extra="forbid" の厳格モードで動作する。
 FR-DM-010: normalize_enum_value による StrEnum ケース正規化。
 """
 
+import warnings
+
 import pytest
 from pydantic import ValidationError
 
@@ -54,6 +56,20 @@ class TestHachimokuBaseModelFrozen:
             model.value = -999  # type: ignore[assignment]
 
 
+class TestHachimokuBaseModelProtectedNamespaces:
+    """protected_namespaces=() により model_ プレフィックスのフィールドを許容することを検証。"""
+
+    def test_model_prefixed_field_defined_without_warning(self) -> None:
+        """model_ で始まるフィールド名でも警告なくクラス定義できる。"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+
+            class ModelPrefixed(HachimokuBaseModel):
+                model_dump_format: str
+
+        assert ModelPrefixed(model_dump_format="x").model_dump_format == "x"
+
+
 class TestNormalizeEnumValue:
     """normalize_enum_value の動作を検証。
 
@@ -100,3 +116,11 @@ class TestNormalizeEnumValue:
     def test_none_passthrough(self) -> None:
         """None はそのまま返される。"""
         assert normalize_enum_value(None, Severity) is None
+
+    def test_distinct_enum_classes_normalized_independently(self) -> None:
+        """StrEnum クラスごとに独立して正規化される。"""
+        from hachimoku.models.report import Priority
+
+        assert normalize_enum_value("HIGH", Priority) == "high"
+        assert normalize_enum_value("HIGH", Severity) == "HIGH"
+        assert normalize_enum_value("CRITICAL", Severity) == "Critical"
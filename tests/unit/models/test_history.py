@@ -3,6 +3,7 @@
 FR-DM-011: ReviewHistoryRecord 判別共用体。
 """
 
+import json
 from datetime import datetime, timezone
 
 import pytest
@@ -10,12 +11,14 @@ from pydantic import TypeAdapter, ValidationError
 
 from hachimoku.models.agent_result import AgentSuccess
 from hachimoku.models.history import (
+    REVIEW_HISTORY_ADAPTER,
     CommitHash,
     CommitReviewRecord,
     DiffReviewRecord,
     FileReviewRecord,
     PRReviewRecord,
-    ReviewHistoryRecord,
+    dump_history_record,
+    load_history_record,
 )
 from hachimoku.models.report import ReviewSummary
 from hachimoku.models.severity import Severity
@@ -595,9 +598,7 @@ class TestCommitReviewRecordConstraints:
 # ReviewHistoryRecord (判別共用体)
 # =============================================================================
 
-history_adapter: TypeAdapter[
-    DiffReviewRecord | PRReviewRecord | FileReviewRecord | CommitReviewRecord
-] = TypeAdapter(ReviewHistoryRecord)
+history_adapter = REVIEW_HISTORY_ADAPTER
 
 
 class TestReviewHistoryRecordDiscriminator:
@@ -798,3 +799,157 @@ class TestReviewHistoryRecordRoundTrip:
         assert isinstance(restored, FileReviewRecord)
         assert isinstance(restored.file_paths, frozenset)
         assert restored == original
+
+
+class TestReviewHistoryAdapter:
+    """REVIEW_HISTORY_ADAPTER の判別共用体スキーマを検証。"""
+
+    def test_adapter_uses_tagged_union(self) -> None:
+        """review_mode をキーとする tagged-union スキーマが構築されている。"""
+        schema = REVIEW_HISTORY_ADAPTER.core_schema
+        while schema["type"] == "definitions":
+            schema = schema["schema"]
+        assert schema["type"] == "tagged-union"
+        assert set(schema["choices"]) == {"diff", "pr", "file", "commit"}
+
+
+class TestHistoryRecordJsonIO:
+    """dump_history_record / load_history_record の JSON 入出力を検証。"""
+
+    def test_dump_returns_single_line_bytes(self) -> None:
+        """dump_history_record は改行を含まない JSON バイト列を返す。"""
+        record = DiffReviewRecord(
+            commit_hash=VALID_COMMIT_HASH,
+            branch_name="main",
+            reviewed_at=VALID_REVIEWED_AT,
+            results=[VALID_AGENT_SUCCESS],
+            summary=VALID_SUMMARY_WITH_ISSUES,
+        )
+        raw = dump_history_record(record)
+        assert isinstance(raw, bytes)
+        assert b"\n" not in raw
+
+    def test_round_trip_selects_variant(self) -> None:
+        """dump → load で review_mode に応じたバリアントが復元される。"""
+        original = PRReviewRecord(
+            commit_hash=VALID_COMMIT_HASH,
+            pr_number=7,
+            branch_name="feat/x",
+            reviewed_at=VALID_REVIEWED_AT,
+            results=[VALID_AGENT_SUCCESS],
+            summary=VALID_SUMMARY_WITH_ISSUES,
+        )
+        restored = load_history_record(dump_history_record(original))
+        assert isinstance(restored, PRReviewRecord)
+        assert restored == original
+
+    def test_load_accepts_str(self) -> None:
+        """load_history_record は str 入力も受け付ける。"""
+        original = FileReviewRecord(
+            file_paths=frozenset({"src/main.py"}),
+            reviewed_at=VALID_REVIEWED_AT,
+            working_directory="/home/user/project",
+            results=[],
+            summary=VALID_SUMMARY,
+        )
+        restored = load_history_record(dump_history_record(original).decode())
+        assert restored == original
+
+    def test_load_invalid_json_rejected(self) -> None:
+        """不正な JSON は ValidationError。"""
+        with pytest.raises(ValidationError):
+            load_history_record(b"{not json")
+
+    @pytest.mark.parametrize(
+        ("record", "expected_keys"),
+        [
+            pytest.param(
+                DiffReviewRecord(
+                    commit_hash=VALID_COMMIT_HASH,
+                    branch_name="main",
+                    reviewed_at=VALID_REVIEWED_AT,
+                    results=[],
+                    summary=VALID_SUMMARY,
+                ),
+                [
+                    "review_mode",
+                    "commit_hash",
+                    "branch_name",
+                    "reviewed_at",
+                    "results",
+                    "summary",
+                ],
+                id="diff",
+            ),
+            pytest.param(
+                PRReviewRecord(
+                    commit_hash=VALID_COMMIT_HASH,
+                    pr_number=7,
+                    branch_name="feat/x",
+                    reviewed_at=VALID_REVIEWED_AT,
+                    results=[],
+                    summary=VALID_SUMMARY,
+                ),
+                [
+                    "review_mode",
+                    "commit_hash",
+                    "pr_number",
+                    "branch_name",
+                    "reviewed_at",
+                    "results",
+                    "summary",
+                ],
+                id="pr",
+            ),
+            pytest.param(
+                FileReviewRecord(
+                    file_paths=frozenset({"src/main.py"}),
+                    reviewed_at=VALID_REVIEWED_AT,
+                    working_directory="/home/user/project",
+                    results=[],
+                    summary=VALID_SUMMARY,
+                ),
+                [
+                    "review_mode",
+                    "file_paths",
+                    "reviewed_at",
+                    "working_directory",
+                    "results",
+                    "summary",
+                ],
+                id="file",
+            ),
+            pytest.param(
+                CommitReviewRecord(
+                    commit_hash=VALID_COMMIT_HASH,
+                    from_ref="main",
+                    to_ref="HEAD",
+                    branch_name="main",
+                    reviewed_at=VALID_REVIEWED_AT,
+                    results=[],
+                    summary=VALID_SUMMARY,
+                ),
+                [
+                    "review_mode",
+                    "commit_hash",
+                    "from_ref",
+                    "to_ref",
+                    "branch_name",
+                    "reviewed_at",
+                    "results",
+                    "summary",
+                ],
+                id="commit",
+            ),
+        ],
+    )
+    def test_dump_key_order_is_stable(
+        self,
+        record: DiffReviewRecord
+        | PRReviewRecord
+        | FileReviewRecord
+        | CommitReviewRecord,
+        expected_keys: list[str],
+    ) -> None:
+        """JSONL のキー順は判別キー・バリアント固有フィールドが先頭（保存形式の固定）。"""
+        assert list(json.loads(dump_history_record(record))) == expected_keys
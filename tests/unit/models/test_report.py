@@ -358,6 +358,18 @@ class TestReviewReportValid:
         )
         assert len(report.results) == 1
 
+    def test_agent_result_instances_not_revalidated(self) -> None:
+        """構築済みの AgentResult はコピーされずそのまま保持される。"""
+        success = AgentSuccess(
+            agent_name="code-reviewer",
+            issues=[],
+            elapsed_time=2.0,
+        )
+        summary = self._make_summary(total_elapsed_time=2.0)
+        report = ReviewReport(results=[success], summary=summary)
+        assert report.results[0] is success
+        assert report.summary is summary
+
     def test_empty_results_accepted(self) -> None:
         """results=[] (空リスト) でインスタンス生成が成功する (SC-006)。"""
         report = ReviewReport(
@@ -806,6 +806,49 @@ class TestCategoryClassificationValid:
         assert isinstance(cat, BaseAgentOutput)
 
 
+class TestCategoryClassificationInterning:
+    """CategoryClassification の ReviewIssue 集約を検証。"""
+
+    def test_duplicate_issues_share_instance(self) -> None:
+        """複数カテゴリに現れる等価な問題は同一インスタンスに集約される。"""
+        cat = CategoryClassification.model_validate(
+            {
+                "issues": [],
+                "categories": {
+                    "style": [
+                        {"agent_name": "a", "severity": "Nitpick", "description": "x"}
+                    ],
+                    "docs": [
+                        {"agent_name": "a", "severity": "Nitpick", "description": "x"}
+                    ],
+                },
+                "overall_score": 7.0,
+            }
+        )
+        assert cat.categories["style"][0] is cat.categories["docs"][0]
+
+    def test_category_issue_reuses_issues_instance(self) -> None:
+        """categories 内の問題は issues 内の等価なインスタンスを参照する。"""
+        issue = _make_review_issue()
+        cat = CategoryClassification(
+            issues=[issue],
+            categories={"style": [_make_review_issue()]},
+            overall_score=7.0,
+        )
+        assert cat.categories["style"][0] is cat.issues[0]
+
+    def test_distinct_issues_preserved(self) -> None:
+        """等価でない問題は集約されない。"""
+        first = _make_review_issue(description="first")
+        second = _make_review_issue(description="second")
+        cat = CategoryClassification(
+            issues=[],
+            categories={"style": [first, second]},
+            overall_score=7.0,
+        )
+        assert cat.categories["style"] == [first, second]
+
+
 class TestCategoryClassificationConstraints:
     """CategoryClassification の制約を検証。"""
 
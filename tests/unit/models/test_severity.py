@@ -10,6 +10,7 @@ from hachimoku.models.severity import (
     SEVERITY_ORDER,
     Severity,
     determine_exit_code,
+    severity_key,
 )
 
 
@@ -160,6 +161,34 @@ class TestSeverityComparison:
         assert max(items) == Severity.CRITICAL
 
 
+class TestSeverityOrderValue:
+    """各メンバーに事前計算された順序値を検証。"""
+
+    @pytest.mark.parametrize("member", list(Severity))
+    def test_order_val_matches_severity_order(self, member: Severity) -> None:
+        """_order_val は SEVERITY_ORDER の値と一致する。"""
+        assert member._order_val == SEVERITY_ORDER[member.value]
+
+
+class TestSeverityKey:
+    """severity_key の順序値を検証。"""
+
+    @pytest.mark.parametrize("member", list(Severity))
+    def test_matches_severity_order(self, member: Severity) -> None:
+        """severity_key は SEVERITY_ORDER と同じ順序値を返す。"""
+        assert severity_key(member) == SEVERITY_ORDER[member.value]
+
+    def test_sorted_matches_comparison_order(self) -> None:
+        """severity_key による整列は比較演算子による整列と一致する。"""
+        items = [
+            Severity.SUGGESTION,
+            Severity.CRITICAL,
+            Severity.NITPICK,
+            Severity.IMPORTANT,
+        ]
+        assert sorted(items, key=severity_key) == sorted(items)
+
+
 class TestSeverityComparisonWithNonSeverity:
     """非 Severity 型との比較で TypeError が送出されることを検証。"""
 
@@ -187,6 +216,15 @@ class TestSeverityComparisonWithNonSeverity:
         with pytest.raises(TypeError, match="'>' not supported"):
             Severity.CRITICAL > 0  # type: ignore[operator]  # noqa: B015
 
+    def test_reflected_comparison_delegated(self) -> None:
+        """非 str 型には NotImplemented を返し、相手側の反射演算に委ねる。"""
+
+        class AlwaysGreater:
+            def __gt__(self, other: object) -> bool:
+                return True
+
+        assert Severity.CRITICAL < AlwaysGreater()  # type: ignore[operator]
+
 
 class TestDetermineExitCode:
     """determine_exit_code() の終了コード決定ロジックを検証。
@@ -227,3 +265,13 @@ class TestDetermineExitCode:
         """未知の Severity 値は ValueError を送出する。"""
         with pytest.raises(ValueError, match="Unknown Severity value"):
             determine_exit_code("Unknown")  # type: ignore[arg-type]
+
+    def test_plain_value_string_accepted(self) -> None:
+        """Severity の値と一致する素の str も受け付ける（従来の辞書引きと同じ挙動）。"""
+        assert determine_exit_code("Critical") == ExitCode.CRITICAL  # type: ignore[arg-type]
+
+    @pytest.mark.parametrize("member", list(Severity))
+    def test_every_member_mapped(self, member: Severity) -> None:
+        """全 Severity メンバーに終了コードが対応付けられている。"""
+        assert isinstance(determine_exit_code(member), ExitCode)
+        assert determine_exit_code(member) is member.exit_code